@@ -68,7 +68,7 @@ from impulse.collection.storage import (
     S3Backend
 )
 from impulse.collection.database import ImpulseDB
-from impulse.collection.rlcs_manager import RLCSManager
+from impulse.collection.rlcs_manager import RLCSManager, Season
 from impulse.collection.utils import (
     load_group_tree,
     save_group_tree,
@@ -87,7 +87,8 @@ def download_group(
     use_database: bool = True,
     database_path: str = "./impulse.db",
     config: Optional[CollectionConfig] = None,
-    is_rlcs: bool = False
+    is_rlcs: bool = False,
+    download_workers: int = ReplayDownloader.DEFAULT_DOWNLOAD_WORKERS
 ) -> DownloadResult:
     """
     Convenience function to download a Ballchasing group with minimal setup.
@@ -104,6 +105,8 @@ def download_group(
         database_path: Path to SQLite database (default: './impulse.db')
         config: Optional CollectionConfig (defaults to loading from environment)
         is_rlcs: Tag all replays in this group as RLCS matches (default: False)
+        download_workers: Concurrent Ballchasing downloads; all share the API
+                          rate limit (default: ReplayDownloader.DEFAULT_DOWNLOAD_WORKERS)
 
     Returns:
         DownloadResult with statistics
@@ -158,7 +161,8 @@ def download_group(
     downloader = ReplayDownloader(
         client=client,
         storage=storage,
-        db=db
+        db=db,
+        download_workers=download_workers
     )
 
     # Download group
@@ -186,6 +190,7 @@ __all__ = [
 
     # Data classes
     'DownloadResult',
+    'Season',
 
     # Tree cache utilities
     'load_group_tree',
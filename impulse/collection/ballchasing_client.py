@@ -5,13 +5,108 @@ Pure API client for interacting with the Ballchasing.com API.
 Handles only HTTP requests and responses - no orchestration logic.
 """
 
-import requests
+import threading
 import time
+import requests
+from requests.adapters import HTTPAdapter
 from requests_ratelimiter import LimiterSession
-from typing import List, Dict, Optional
+from urllib3.util.retry import Retry
+from typing import Any, List, Dict, Optional, Tuple
 from impulse.config.collection_config import CollectionConfig
 
 
+# Keep-alive connections held per host; enough for every download worker
+_POOL_SIZE = 32
+
+# Limiters shared by every client in the process with the same API key and rates
+_shared_limiters: Dict[Tuple[str, int, int], Any] = {}
+_shared_limiters_lock = threading.Lock()
+
+# Retry-After pauses shared by every client in the process with the same API key
+_shared_cooldowns: Dict[str, "_Cooldown"] = {}
+
+
+def _rate_limited_session(api_key: str, per_second: int, per_hour: int) -> LimiterSession:
+    """
+    Create a LimiterSession whose limiter is shared across clients.
+
+    Ballchasing enforces its quotas per API key, so every client using the same
+    key draws from one sliding-window bucket instead of keeping its own count
+    (several clients each allowed the full hourly quota would overrun it).
+    """
+    key = (api_key, per_second, per_hour)
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            session = LimiterSession(per_second=per_second, per_hour=per_hour)
+            _shared_limiters[key] = session.limiter
+            return session
+    return LimiterSession(limiter=limiter)
+
+
+class _Cooldown:
+    """Pause that every request on one API key waits out after Ballchasing sends Retry-After."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._until = 0.0
+
+    def pause(self, seconds: float):
+        """Hold back requests for at least `seconds` from now."""
+        with self._lock:
+            self._until = max(self._until, time.monotonic() + seconds)
+
+    def wait(self):
+        """Sleep until the current pause, if any, has passed."""
+        delay = self._until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _shared_cooldown(api_key: str) -> _Cooldown:
+    """Return the process-wide cooldown for an API key."""
+    with _shared_limiters_lock:
+        cooldown = _shared_cooldowns.get(api_key)
+        if cooldown is None:
+            cooldown = _shared_cooldowns[api_key] = _Cooldown()
+        return cooldown
+
+
+class _CooldownRetry(Retry):
+    """
+    Retry policy that also reports Retry-After to a shared cooldown.
+
+    urllib3 only sleeps the thread that received the 429; every other worker on
+    the key would keep firing into the same window and collect its own 429.
+    """
+
+    cooldown: Optional[_Cooldown] = None
+
+    def new(self, **kw) -> "_CooldownRetry":
+        retry = super().new(**kw)
+        retry.cooldown = self.cooldown
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.cooldown is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after:
+                self.cooldown.pause(retry_after)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class _CooldownAdapter(HTTPAdapter):
+    """HTTPAdapter that waits out the shared cooldown before each request."""
+
+    def __init__(self, cooldown: _Cooldown, **kwargs):
+        self.cooldown = cooldown
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.cooldown.wait()
+        return super().send(request, **kwargs)
+
+
 class BallchasingClient:
     """
     Pure API client for Ballchasing.com.
@@ -39,10 +134,28 @@ class BallchasingClient:
         self.rate_limit_per_hour = rate_limit_per_hour if rate_limit_per_hour else config.rate_limit_per_hour
 
 
-        # Create HTTP session with auth headers
-        self.session = LimiterSession(per_second=self.rate_limit_per_second, per_hour=self.rate_limit_per_hour)
+        # Create HTTP session with auth headers. The session's limiter paces every
+        # request against both rates, so the request methods never sleep themselves.
+        self.session = _rate_limited_session(self.api_key, self.rate_limit_per_second, self.rate_limit_per_hour)
         self.session.headers.update({"Authorization": self.api_key})
 
+        # Reuse pooled keep-alive connections across requests and worker threads
+        # instead of paying a TCP + TLS handshake per replay. Transient errors
+        # and 429s are retried with backoff (honouring Retry-After); a final
+        # error status is still returned, so callers raise HTTPError as before.
+        # A Retry-After from the server pauses every client on this API key,
+        # not just the thread that was told to back off.
+        cooldown = _shared_cooldown(self.api_key)
+        retries = _CooldownRetry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        retries.cooldown = cooldown
+        adapter = _CooldownAdapter(cooldown, pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retries)
+        self.session.mount("https://", adapter)
+
     def get_group_info(self, group_id: str) -> Dict:
         """
         Fetch metadata for a Ballchasing group.
@@ -110,7 +223,6 @@ class BallchasingClient:
                 break
 
             after = batch[-1]['id'] if batch else None
-            time.sleep(0.5)  # Brief pause between pagination requests
 
         return children
 
@@ -154,7 +266,6 @@ class BallchasingClient:
                 break
 
             after = data.get('next')
-            time.sleep(0.5)  # Brief pause between pagination requests
 
         return replays
 
@@ -259,5 +370,4 @@ class BallchasingClient:
             if progress_callback:
                 progress_callback(f"Found {len(replays)} replays", depth)
 
-        time.sleep(0.5)  # Brief pause between groups
         return tree
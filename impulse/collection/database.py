@@ -5,38 +5,176 @@ Tracks both raw replay downloads and parsed replay data in a single database.
 """
 
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
 if TYPE_CHECKING:
     from impulse.collection.s3_manager import S3Manager
 
 
+_RAW_REPLAY_COLUMNS = """
+    replay_id, group_id, title, date,
+    duration, overtime, overtime_seconds,
+    map_code, map_name, match_type, team_size, season, season_type,
+    blue_team, blue_goals, orange_team, orange_goals,
+    playlist_id,
+    min_rank, min_rank_tier, min_rank_division,
+    max_rank, max_rank_tier, max_rank_division,
+    uploader_name, uploader_steam_id,
+    is_rlcs, is_downloaded
+"""
+_RAW_REPLAY_VALUES = "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)"
+
+
+def _raw_replay_row(
+    replay_id: str,
+    ballchasing_metadata: Dict,
+    group_id: Optional[str],
+    is_rlcs: bool
+) -> Tuple:
+    """Build the raw_replays insert parameters from Ballchasing replay metadata."""
+    blue = ballchasing_metadata.get('blue') or {}
+    orange = ballchasing_metadata.get('orange') or {}
+    min_rank_obj = ballchasing_metadata.get('min_rank') or {}
+    max_rank_obj = ballchasing_metadata.get('max_rank') or {}
+    uploader = ballchasing_metadata.get('uploader') or {}
+
+    return (
+        replay_id,
+        group_id,
+        ballchasing_metadata.get('title', 'Unknown'),
+        ballchasing_metadata.get('date'),
+        ballchasing_metadata.get('duration'),
+        int(bool(ballchasing_metadata.get('overtime', False))),
+        ballchasing_metadata.get('overtime_seconds'),
+        ballchasing_metadata.get('map_code'),
+        ballchasing_metadata.get('map_name'),
+        ballchasing_metadata.get('match_type'),
+        ballchasing_metadata.get('team_size'),
+        ballchasing_metadata.get('season'),
+        ballchasing_metadata.get('season_type'),
+        blue.get('name', 'Unknown'),
+        blue.get('goals'),
+        orange.get('name', 'Unknown'),
+        orange.get('goals'),
+        ballchasing_metadata.get('playlist_id'),
+        min_rank_obj.get('name'),
+        min_rank_obj.get('tier'),
+        min_rank_obj.get('division'),
+        max_rank_obj.get('name'),
+        max_rank_obj.get('tier'),
+        max_rank_obj.get('division'),
+        uploader.get('name'),
+        uploader.get('steam_id'),
+        int(is_rlcs)
+    )
+
+
 class ImpulseDB:
-    """Manages SQLite database for replay tracking (raw and parsed)."""
+    """Manages SQLite database for replay tracking (raw and parsed).
+
+    Holds one persistent connection in WAL mode for the lifetime of the
+    instance; call close() when done with it.
+    """
+
+    # How long a write waits for another process's write lock (parse shards
+    # share one database file) before failing with "database is locked"
+    BUSY_TIMEOUT_SECONDS = 60.0
 
     def __init__(self, db_path: str = "./impulse.db", s3_manager: "Optional[S3Manager]" = None):
         self.db_path = Path(db_path)
         self.s3_manager = s3_manager
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        # Downloaded raw replay IDs, loaded on first is_replay_downloaded() call
+        self._downloaded_ids: Optional[set] = None
+        # Parsed replay IDs, loaded on first is_replay_parsed() call
+        self._parsed_ids: Optional[set] = None
+        # Cache updates deferred until the open transaction commits
+        self._commit_hooks: List[Callable[[], None]] = []
         self.init_database()
         print(f"Database initialized: {self.db_path}")
 
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection. Transactions are managed by get_connection()."""
+        conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False,
+            timeout=self.BUSY_TIMEOUT_SECONDS
+        )
         conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def get_connection(self, write: bool = True):
+        """
+        Context manager yielding the shared connection inside a transaction.
+
+        Commits on success and rolls back on error. Nested use joins the
+        enclosing transaction. Hooks registered with _after_commit() run once
+        the outermost transaction commits; on rollback they are dropped and
+        the ID caches reset, so the caches never hold uncommitted rows.
+
+        Write transactions start with BEGIN IMMEDIATE, taking the write lock up
+        front. A deferred transaction that reads and then writes fails at once
+        with SQLITE_BUSY if another process committed in between; IMMEDIATE
+        waits up to BUSY_TIMEOUT_SECONDS for the lock instead.
+
+        Args:
+            write: False for read-only transactions, which start deferred
+        """
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                raise RuntimeError("Database connection is closed")
+            if conn.in_transaction:
+                yield conn
+                return
+            self._commit_hooks.clear()
+            conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                # BaseException so a KeyboardInterrupt can't leave the shared
+                # connection stuck inside an open write transaction
+                conn.execute("ROLLBACK")
+                self._commit_hooks.clear()
+                self.invalidate_caches()
+                raise
+            hooks, self._commit_hooks = self._commit_hooks, []
+            for hook in hooks:
+                hook()
+
+    def invalidate_caches(self):
+        """
+        Drop the in-memory downloaded/parsed ID caches.
+
+        They reload from the database on next use. Call this after other
+        processes have written to the same database file, since the caches
+        only track writes made through this instance.
+        """
+        with self._lock:
+            self._downloaded_ids = None
+            self._parsed_ids = None
+
+    def _after_commit(self, hook: Callable[[], None]):
+        """Run hook once the transaction open in get_connection() commits."""
+        self._commit_hooks.append(hook)
 
     def init_database(self):
         """Create all tables if they don't exist."""
@@ -154,6 +292,11 @@ class ImpulseDB:
                 CREATE INDEX IF NOT EXISTS idx_parsed_replays_status
                 ON parsed_replays(parse_status)
             """)
+            # Covers the downloaded-ID scan without touching the table
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_raw_replays_downloaded_partial
+                ON raw_replays(replay_id) WHERE is_downloaded = 1
+            """)
 
     # =========================================================================
     # Group Methods
@@ -255,7 +398,7 @@ class ImpulseDB:
         Returns a dict with all group fields including download_status,
         storage_path, and result counts.
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM groups WHERE group_id = ?", (group_id,))
             row = cursor.fetchone()
@@ -263,7 +406,7 @@ class ImpulseDB:
 
     def is_group_downloaded(self, group_id: str) -> bool:
         """Return True only if the group's download_status is 'complete'."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT download_status FROM groups WHERE group_id = ?", (group_id,)
@@ -304,7 +447,7 @@ class ImpulseDB:
 
     def get_failed_replays_for_group(self, group_id: str) -> List[Dict]:
         """Get all failed replay records belonging to a specific group."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT replay_id, title, error_message
@@ -336,66 +479,56 @@ class ImpulseDB:
             if cursor.fetchone() is not None:
                 return False
 
-            blue = ballchasing_metadata.get('blue') or {}
-            orange = ballchasing_metadata.get('orange') or {}
-            min_rank_obj = ballchasing_metadata.get('min_rank') or {}
-            max_rank_obj = ballchasing_metadata.get('max_rank') or {}
-            uploader = ballchasing_metadata.get('uploader') or {}
-
-            cursor.execute("""
-                INSERT INTO raw_replays (
-                    replay_id, group_id, title, date,
-                    duration, overtime, overtime_seconds,
-                    map_code, map_name, match_type, team_size, season, season_type,
-                    blue_team, blue_goals, orange_team, orange_goals,
-                    playlist_id,
-                    min_rank, min_rank_tier, min_rank_division,
-                    max_rank, max_rank_tier, max_rank_division,
-                    uploader_name, uploader_steam_id,
-                    is_rlcs, is_downloaded
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-            """, (
-                replay_id,
-                group_id,
-                ballchasing_metadata.get('title', 'Unknown'),
-                ballchasing_metadata.get('date'),
-                ballchasing_metadata.get('duration'),
-                int(bool(ballchasing_metadata.get('overtime', False))),
-                ballchasing_metadata.get('overtime_seconds'),
-                ballchasing_metadata.get('map_code'),
-                ballchasing_metadata.get('map_name'),
-                ballchasing_metadata.get('match_type'),
-                ballchasing_metadata.get('team_size'),
-                ballchasing_metadata.get('season'),
-                ballchasing_metadata.get('season_type'),
-                blue.get('name', 'Unknown'),
-                blue.get('goals'),
-                orange.get('name', 'Unknown'),
-                orange.get('goals'),
-                ballchasing_metadata.get('playlist_id'),
-                min_rank_obj.get('name'),
-                min_rank_obj.get('tier'),
-                min_rank_obj.get('division'),
-                max_rank_obj.get('name'),
-                max_rank_obj.get('tier'),
-                max_rank_obj.get('division'),
-                uploader.get('name'),
-                uploader.get('steam_id'),
-                int(is_rlcs)
-            ))
+            cursor.execute(
+                f"INSERT INTO raw_replays ({_RAW_REPLAY_COLUMNS}) {_RAW_REPLAY_VALUES}",
+                _raw_replay_row(replay_id, ballchasing_metadata, group_id, is_rlcs)
+            )
 
             return True
 
-    def is_replay_downloaded(self, replay_id: str) -> bool:
-        """Check if raw replay has been downloaded already."""
+    def add_replays_bulk(
+        self,
+        items: List[Tuple[str, Dict]],
+        group_id: Optional[str] = None,
+        is_rlcs: bool = False
+    ) -> int:
+        """
+        Add many raw replays in a single transaction.
+
+        Replays already in the database are left untouched, as in add_replay().
+
+        Args:
+            items: (replay_id, ballchasing_metadata) pairs
+            group_id: Ballchasing group ID recorded for every replay
+            is_rlcs: Whether to tag every replay as an RLCS match
+
+        Returns:
+            Number of replays that were new
+        """
+        rows = [
+            _raw_replay_row(replay_id, metadata, group_id, is_rlcs)
+            for replay_id, metadata in items
+        ]
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT is_downloaded FROM raw_replays
-                WHERE replay_id = ? AND is_downloaded = 1
-            """, (replay_id,))
-            return cursor.fetchone() is not None
+            cursor.executemany(
+                f"INSERT OR IGNORE INTO raw_replays ({_RAW_REPLAY_COLUMNS}) {_RAW_REPLAY_VALUES}",
+                rows
+            )
+            return cursor.rowcount
+
+    def _ensure_downloaded_cache(self) -> set:
+        """Load the set of downloaded raw replay IDs once; kept current by mark_downloaded()."""
+        with self._lock:
+            if self._downloaded_ids is None:
+                with self.get_connection(write=False) as conn:
+                    cursor = conn.execute("SELECT replay_id FROM raw_replays WHERE is_downloaded = 1")
+                    self._downloaded_ids = {row[0] for row in cursor}
+            return self._downloaded_ids
+
+    def is_replay_downloaded(self, replay_id: str) -> bool:
+        """Check if raw replay has been downloaded already."""
+        return replay_id in self._ensure_downloaded_cache()
 
     def mark_downloaded(self, replay_id: str, storage_key: str, file_size: int):
         """Mark a raw replay as downloaded with its storage location."""
@@ -410,6 +543,29 @@ class ImpulseDB:
                     download_status = 'downloaded'
                 WHERE replay_id = ?
             """, (storage_key, file_size, datetime.now(timezone.utc).isoformat(), replay_id))
+            if cursor.rowcount:
+                self._after_commit(lambda: self._cache_downloaded(replay_id))
+
+    def _cache_downloaded(self, replay_id: str):
+        """Record a committed download in the ID cache, if it is loaded."""
+        if self._downloaded_ids is not None:
+            self._downloaded_ids.add(replay_id)
+
+    def mark_downloaded_bulk(self, items: List[Tuple[str, str, int]]):
+        """
+        Mark many raw replays as downloaded in a single transaction.
+
+        All or nothing: if any row fails, the whole batch is rolled back and
+        none of its replays count as downloaded.
+
+        Args:
+            items: (replay_id, storage_key, file_size) triples, as passed to mark_downloaded()
+        """
+        if not items:
+            return
+        with self.get_connection():
+            for replay_id, storage_key, file_size in items:
+                self.mark_downloaded(replay_id, storage_key, file_size)
 
     def mark_replay_failed(self, replay_id: str, error_message: str = None):
         """Mark a raw replay download as failed."""
@@ -424,7 +580,7 @@ class ImpulseDB:
 
     def get_failed_replays(self) -> List[Dict]:
         """Get all raw replays that failed to download (across all groups)."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT replay_id, group_id, title, error_message
@@ -435,7 +591,7 @@ class ImpulseDB:
 
     def get_downloaded_replays(self, limit: Optional[int] = None) -> List[Dict]:
         """Get all successfully downloaded raw replays."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             query = """
                 SELECT replay_id, group_id, title, date, blue_team, orange_team,
@@ -531,17 +687,22 @@ class ImpulseDB:
                 playlist_id, min_rank, min_rank_tier, max_rank, max_rank_tier, is_rlcs
             ))
 
+            self._after_commit(lambda: self._cache_parsed(replay_id, True))
+
             return cursor.rowcount > 0
 
+    def _ensure_parsed_cache(self) -> set:
+        """Load the set of parsed replay IDs once; kept current by the parse status writers."""
+        with self._lock:
+            if self._parsed_ids is None:
+                with self.get_connection(write=False) as conn:
+                    cursor = conn.execute("SELECT replay_id FROM parsed_replays WHERE parse_status = 'parsed'")
+                    self._parsed_ids = {row[0] for row in cursor}
+            return self._parsed_ids
+
     def is_replay_parsed(self, replay_id: str) -> bool:
         """Check if a replay has been parsed already."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT replay_id FROM parsed_replays
-                WHERE replay_id = ? AND parse_status = 'parsed'
-            """, (replay_id,))
-            return cursor.fetchone() is not None
+        return replay_id in self._ensure_parsed_cache()
 
     def mark_parse_failed(self, replay_id: str, raw_replay_id: str, error_message: str = None):
         """Mark a replay parsing as failed."""
@@ -554,10 +715,19 @@ class ImpulseDB:
                     parse_status = 'failed',
                     error_message = excluded.error_message
             """, (replay_id, raw_replay_id, error_message))
+            self._after_commit(lambda: self._cache_parsed(replay_id, False))
+
+    def _cache_parsed(self, replay_id: str, parsed: bool):
+        """Record a committed parse status change in the ID cache, if it is loaded."""
+        if self._parsed_ids is not None:
+            if parsed:
+                self._parsed_ids.add(replay_id)
+            else:
+                self._parsed_ids.discard(replay_id)
 
     def get_unparsed_replays(self, limit: Optional[int] = None) -> List[Dict]:
         """Get downloaded replays that haven't been successfully parsed yet."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             query = """
                 SELECT r.replay_id, r.title, r.storage_key, r.file_size_bytes
@@ -573,7 +743,7 @@ class ImpulseDB:
 
     def get_parsed_replays(self, limit: Optional[int] = None) -> List[Dict]:
         """Get all successfully parsed replays."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             query = """
                 SELECT replay_id, raw_replay_id, output_path, output_format,
@@ -588,7 +758,7 @@ class ImpulseDB:
 
     def get_failed_parses(self) -> List[Dict]:
         """Get all replays that failed to parse, including storage_key for S3 access."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT p.replay_id, p.raw_replay_id, p.error_message, r.storage_key
@@ -626,7 +796,7 @@ class ImpulseDB:
         Returns:
             JSON string of boundaries, or None if not computed yet.
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT segment_boundaries FROM parsed_replays
@@ -642,7 +812,7 @@ class ImpulseDB:
         Returns:
             List of dicts with replay_id and output_path.
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             query = """
                 SELECT replay_id, output_path
@@ -660,20 +830,23 @@ class ImpulseDB:
 
     def get_stats(self) -> Dict:
         """Get statistics for raw replays."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT COUNT(*) as total FROM raw_replays")
-            total = cursor.fetchone()['total']
-
-            cursor.execute("SELECT COUNT(*) as downloaded FROM raw_replays WHERE is_downloaded = 1")
-            downloaded = cursor.fetchone()['downloaded']
-
-            cursor.execute("SELECT SUM(file_size_bytes) as bytes FROM raw_replays WHERE is_downloaded = 1")
-            total_bytes = cursor.fetchone()['bytes'] or 0
-
-            cursor.execute("SELECT COUNT(*) as failed FROM raw_replays WHERE download_status = 'failed'")
-            failed = cursor.fetchone()['failed']
+            # One pass over the table for all counters
+            cursor.execute("""
+                SELECT
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE is_downloaded = 1) as downloaded,
+                    COALESCE(SUM(file_size_bytes) FILTER (WHERE is_downloaded = 1), 0) as bytes,
+                    COUNT(*) FILTER (WHERE download_status = 'failed') as failed
+                FROM raw_replays
+            """)
+            row = cursor.fetchone()
+            total = row['total']
+            downloaded = row['downloaded']
+            total_bytes = row['bytes']
+            failed = row['failed']
 
             return {
                 'total_replays': total,
@@ -686,23 +859,25 @@ class ImpulseDB:
 
     def get_parse_stats(self) -> Dict:
         """Get statistics for parsed replays."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT COUNT(*) as total FROM parsed_replays")
-            total = cursor.fetchone()['total']
-
-            cursor.execute("SELECT COUNT(*) as parsed FROM parsed_replays WHERE parse_status = 'parsed'")
-            parsed = cursor.fetchone()['parsed']
-
-            cursor.execute("SELECT SUM(file_size_bytes) as bytes FROM parsed_replays WHERE parse_status = 'parsed'")
-            total_bytes = cursor.fetchone()['bytes'] or 0
-
-            cursor.execute("SELECT COUNT(*) as failed FROM parsed_replays WHERE parse_status = 'failed'")
-            failed = cursor.fetchone()['failed']
-
-            cursor.execute("SELECT SUM(frame_count) as frames FROM parsed_replays WHERE parse_status = 'parsed'")
-            total_frames = cursor.fetchone()['frames'] or 0
+            # One pass over the table for all counters
+            cursor.execute("""
+                SELECT
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE parse_status = 'parsed') as parsed,
+                    COALESCE(SUM(file_size_bytes) FILTER (WHERE parse_status = 'parsed'), 0) as bytes,
+                    COUNT(*) FILTER (WHERE parse_status = 'failed') as failed,
+                    COALESCE(SUM(frame_count) FILTER (WHERE parse_status = 'parsed'), 0) as frames
+                FROM parsed_replays
+            """)
+            row = cursor.fetchone()
+            total = row['total']
+            parsed = row['parsed']
+            total_bytes = row['bytes']
+            failed = row['failed']
+            total_frames = row['frames']
 
             return {
                 'total_entries': total,
@@ -739,7 +914,10 @@ class ImpulseDB:
         """
         if self.s3_manager is None:
             raise RuntimeError("push() requires an s3_manager. Pass one to ImpulseDB().")
-        return self.s3_manager.backup_database(str(self.db_path), s3_prefix)
+        with self._lock:
+            # Fold the WAL into the main file so the uploaded copy is complete
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return self.s3_manager.backup_database(str(self.db_path), s3_prefix)
 
     def pull(self, s3_prefix: str = "database-backups") -> bool:
         """
@@ -757,4 +935,13 @@ class ImpulseDB:
         """
         if self.s3_manager is None:
             raise RuntimeError("pull() requires an s3_manager. Pass one to ImpulseDB().")
-        return self.s3_manager.restore_database(str(self.db_path), s3_prefix)
+        with self._lock:
+            # Release the file (closing the last connection checkpoints and
+            # removes the WAL) before it is overwritten, then reopen on the
+            # restored copy
+            self.close()
+            self.invalidate_caches()
+            try:
+                return self.s3_manager.restore_database(str(self.db_path), s3_prefix)
+            finally:
+                self._conn = self._connect()
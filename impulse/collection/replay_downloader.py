@@ -6,6 +6,8 @@ Provides progress reporting and error handling.
 """
 
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 
@@ -57,11 +59,22 @@ class ReplayDownloader:
         >>> result = downloader.download_group('rlcs-2024-abc123')
     """
 
+    # Concurrent Ballchasing downloads (all share the client's rate limiter)
+    DEFAULT_DOWNLOAD_WORKERS = 4
+    # Storage writes allowed to run concurrently with downloads
+    DEFAULT_SAVE_WORKERS = 8
+    # Replays downloading or waiting on a storage write (~1.8 MB each)
+    MAX_IN_FLIGHT = 128
+    # Downloaded replays recorded per database transaction
+    DB_BATCH_SIZE = 100
+
     def __init__(
         self,
         client: BallchasingClient,
         storage: StorageBackend = LocalBackend(),
-        db: Optional[ImpulseDB] = None
+        db: Optional[ImpulseDB] = None,
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        save_workers: int = DEFAULT_SAVE_WORKERS
     ):
         """
         Initialize replay downloader.
@@ -70,10 +83,17 @@ class ReplayDownloader:
             client: Ballchasing API client
             storage: Storage backend (S3, local, etc.)
             db: Optional database for tracking (enables deduplication and resume)
+            download_workers: Number of threads downloading from Ballchasing. The
+                              rate limit still caps request starts; more workers
+                              keep requests in flight while earlier ones transfer.
+            save_workers: Number of threads writing replays to storage while
+                          downloads continue
         """
         self.client = client
         self.storage = storage
         self.db = db
+        self.download_workers = download_workers
+        self.save_workers = save_workers
 
     def download_group(
         self,
@@ -170,9 +190,9 @@ class ReplayDownloader:
                 storage_path=storage_path,
                 include_root_in_path=include_root_in_path
             )
-            new_count = sum(
-                1 for replay, _ in replay_list
-                if self.db.add_replay(replay['id'], replay, group_id=tree['id'], is_rlcs=is_rlcs)
+            new_count = self.db.add_replays_bulk(
+                [(replay['id'], replay) for replay, _ in replay_list],
+                group_id=tree['id'], is_rlcs=is_rlcs
             )
             logger.info(f"Registered {new_count} new replays, {total_in_tree - new_count} already known")
 
@@ -187,44 +207,49 @@ class ReplayDownloader:
         width = len(str(total_replays))
         root_name = tree.get('name', group_id)
 
-        for i, (replay, group_path) in enumerate(replay_list, 1):
-            replay_id = replay['id']
-            counter = f"[{i:{width}}/{total_replays}]"
-
-            components = (path_prefix.copy() if path_prefix else []) + build_path_components(
-                group_path, root_name, include_root=include_root_in_path
-            )
-            storage_key = self.storage.get_storage_key(replay_id, components)
-
-            # Check database first (resume capability)
-            if self.db and self.db.is_replay_downloaded(replay_id):
-                print(f"{counter} {replay_id}  skipped")
-                skipped += 1
-                continue
-
-            # Check storage directly (double-check / sync)
-            if self.storage.replay_exists(replay_id, components):
-                size = self.storage.get_replay_size(replay_id, components)
-                if self.db:
-                    self.db.mark_downloaded(replay_id, storage_key, size)
-                print(f"{counter} {replay_id}  skipped")
-                skipped += 1
-                continue
-
-            # Download and save
+        # Two pooled stages: download workers fetch from Ballchasing (the client's
+        # shared rate limiter paces them) and hand each payload to the save pool,
+        # so fetches overlap each other and the uploads. At most MAX_IN_FLIGHT
+        # replays are downloading or awaiting a save, which bounds memory.
+        # Results are handled here, in submission order, so database updates and
+        # progress lines stay on a single thread. Successful downloads are
+        # recorded DB_BATCH_SIZE at a time in one transaction; any left unrecorded
+        # by a crash are still in storage and get re-marked on the next run.
+        pending = deque()
+        downloaded = []
+
+        def record_downloaded(replay_id, storage_key, file_size):
+            if self.db:
+                downloaded.append((replay_id, storage_key, file_size))
+                if len(downloaded) >= self.DB_BATCH_SIZE:
+                    flush_downloaded()
+
+        def flush_downloaded():
+            if downloaded:
+                self.db.mark_downloaded_bulk(downloaded)
+                downloaded.clear()
+
+        def fetch(replay_id, components, metadata):
+            replay_bytes = self.client.download_replay_bytes(replay_id)
+            save = save_pool.submit(self.storage.save_replay, replay_id, replay_bytes, components, metadata)
+            return save, len(replay_bytes)
+
+        def oldest_done():
+            download = pending[0][0]
+            if not download.done():
+                return False
+            return download.exception() is not None or download.result()[0].done()
+
+        def finish_oldest():
+            nonlocal successful, failed, total_bytes
+            download, counter, replay_id, storage_key = pending.popleft()
             try:
-                replay_bytes = self.client.download_replay_bytes(replay_id)
-                file_size = len(replay_bytes)
-
-                metadata = extract_replay_metadata(replay)
-                metadata['group_id'] = group_id
-
-                save_result = self.storage.save_replay(replay_id, replay_bytes, components, metadata)
+                save, file_size = download.result()
+                save_result = save.result()
                 if not save_result['success']:
                     raise Exception(save_result.get('error', 'Storage save failed'))
 
-                if self.db:
-                    self.db.mark_downloaded(replay_id, storage_key, file_size)
+                record_downloaded(replay_id, storage_key, file_size)
 
                 successful += 1
                 total_bytes += file_size
@@ -242,6 +267,61 @@ class ReplayDownloader:
                 failed_replays.append({'replay_id': replay_id, 'error': error_msg})
                 print(f"{counter} {replay_id}  FAILED: {error_msg}")
 
+        save_pool = ThreadPoolExecutor(max_workers=self.save_workers)
+        download_pool = ThreadPoolExecutor(max_workers=self.download_workers)
+        try:
+            for i, (replay, group_path) in enumerate(replay_list, 1):
+                replay_id = replay['id']
+                counter = f"[{i:{width}}/{total_replays}]"
+
+                # Report finished replays as they complete
+                while pending and oldest_done():
+                    finish_oldest()
+
+                components = (path_prefix.copy() if path_prefix else []) + build_path_components(
+                    group_path, root_name, include_root=include_root_in_path
+                )
+                storage_key = self.storage.get_storage_key(replay_id, components)
+
+                # Check database first (resume capability)
+                if self.db and self.db.is_replay_downloaded(replay_id):
+                    print(f"{counter} {replay_id}  skipped")
+                    skipped += 1
+                    continue
+
+                # Check storage directly (double-check / sync)
+                if self.storage.replay_exists(replay_id, components):
+                    size = self.storage.get_replay_size(replay_id, components)
+                    record_downloaded(replay_id, storage_key, size)
+                    print(f"{counter} {replay_id}  skipped")
+                    skipped += 1
+                    continue
+
+                metadata = extract_replay_metadata(replay)
+                metadata['group_id'] = group_id
+
+                if len(pending) >= self.MAX_IN_FLIGHT:
+                    finish_oldest()
+
+                download = download_pool.submit(fetch, replay_id, components, metadata)
+                pending.append((download, counter, replay_id, storage_key))
+
+            while pending:
+                finish_oldest()
+        finally:
+            # On an error or Ctrl-C, drop queued fetches and saves rather than
+            # pushing each through the rate limiter before the exception
+            # surfaces, then record the replays whose saves already finished
+            download_pool.shutdown(cancel_futures=True)
+            save_pool.shutdown(cancel_futures=True)
+            for download, _, replay_id, storage_key in pending:
+                if download.cancelled() or download.exception() is not None:
+                    continue
+                save, file_size = download.result()
+                if not save.cancelled() and save.exception() is None and save.result()['success']:
+                    record_downloaded(replay_id, storage_key, file_size)
+            flush_downloaded()
+
         # Finalize group status in database
         if self.db and not only_replay_ids:
             self.db.finalize_group_download(tree['id'], successful, failed, skipped)
@@ -5,12 +5,40 @@ This module provides a high-level interface for downloading complete RLCS season
 from Ballchasing to local or S3 storage.
 """
 
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-import json
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+import gzip
 from pathlib import Path
 
 from impulse.collection.storage import S3Backend
+from impulse.collection.s3_manager import S3Manager
+from impulse.collection.utils import dumps_json
+
+
+# Average replay size in MB (loose estimate, updated 12-16-2025)
+# TODO: Update with computed average from actual downloads
+AVG_REPLAY_SIZE_MB = 1.8
+
+
+@dataclass(frozen=True, slots=True)
+class Season:
+    """Ballchasing group and size estimate for one RLCS season."""
+    group_id: str
+    name: str
+    estimated_replay_count: int
+    is_active: bool
+    last_updated: str
+
+    @property
+    def estimated_size_gb(self) -> float:
+        """Estimated total download size in GB."""
+        return self.estimated_replay_count * AVG_REPLAY_SIZE_MB / 1000
+
+
+# Fields read from each entry of the S3 season table; any others are ignored
+_SEASON_FIELDS = frozenset(f.name for f in fields(Season))
 
 
 class RLCSManager:
@@ -36,53 +64,19 @@ class RLCSManager:
         info = RLCSManager.get_season_info('2024')
     """
 
-    # Average replay size in MB (loose estimate, updated 12-16-2025)
-    # TODO: Update with computed average from actual downloads
-    AVG_REPLAY_SIZE_MB = 1.8
-
-    # RLCS Season Ballchasing Group IDs
-    SEASONS = {
-        '21-22': {
-            'group_id': 'rlcs-21-22-jl7xcwxrpc',
-            'name': 'RLCS 2021-2022',
-            'estimated_replay_count': 5915,
-            'estimated_size_gb': 5915 * AVG_REPLAY_SIZE_MB / 1000,
-            'is_active': False,
-            'last_updated': '2025-12-16'
-        },
-        '22-23': {
-            'group_id': 'rlcs-22-23-jjc408bdu4',
-            'name': 'RLCS 2022-2023',
-            'estimated_replay_count': 15443,
-            'estimated_size_gb': 15443 * AVG_REPLAY_SIZE_MB / 1000,
-            'is_active': False,
-            'last_updated': '2025-12-16'
-        },
-        '2024': {
-            'group_id': 'rlcs-2024-jsvrszynst',
-            'name': 'RLCS 2024',
-            'estimated_replay_count': 7324,
-            'estimated_size_gb': 7324 * AVG_REPLAY_SIZE_MB / 1000,
-            'is_active': False,
-            'last_updated': '2025-12-16'
-        },
-        '2025': {
-            'group_id': 'rlcs-2025-7ielfd7uhx',
-            'name': 'RLCS 2025',
-            'estimated_replay_count': 7038,
-            'estimated_size_gb': 7038 * AVG_REPLAY_SIZE_MB / 1000,
-            'is_active': False,
-            'last_updated': '2025-12-16'
-        },
-        '2026': {
-            'group_id': 'rlcs-2026-d3chsz8nje',
-            'name': 'RLCS 2026',
-            'estimated_replay_count': 834,
-            'estimated_size_gb': 834 * AVG_REPLAY_SIZE_MB / 1024,
-            'is_active': True,
-            'last_updated': '2025-12-16'
-        }
-    }
+    # S3 key of a JSON season table ({season_key: {group_id, name, ...}}) that adds
+    # or updates seasons without a code change; see load_seasons_from_s3()
+    SEASONS_S3_KEY = 'config/rlcs_seasons.json'
+
+    # RLCS Season Ballchasing Group IDs (bundled defaults). Read-only: the table
+    # is only replaced wholesale, by load_seasons_from_s3().
+    SEASONS: Mapping[str, Season] = MappingProxyType({
+        '21-22': Season('rlcs-21-22-jl7xcwxrpc', 'RLCS 2021-2022', 5915, is_active=False, last_updated='2025-12-16'),
+        '22-23': Season('rlcs-22-23-jjc408bdu4', 'RLCS 2022-2023', 15443, is_active=False, last_updated='2025-12-16'),
+        '2024': Season('rlcs-2024-jsvrszynst', 'RLCS 2024', 7324, is_active=False, last_updated='2025-12-16'),
+        '2025': Season('rlcs-2025-7ielfd7uhx', 'RLCS 2025', 7038, is_active=False, last_updated='2025-12-16'),
+        '2026': Season('rlcs-2026-d3chsz8nje', 'RLCS 2026', 834, is_active=True, last_updated='2025-12-16'),
+    })
 
     def __init__(
         self,
@@ -112,7 +106,7 @@ class RLCSManager:
         self.use_database = use_database
 
     @classmethod
-    def get_season_info(cls, season_key: str) -> Dict[str, Any]:
+    def get_season_info(cls, season_key: str) -> Season:
         """
         Get metadata for a specific season.
 
@@ -120,7 +114,7 @@ class RLCSManager:
             season_key: Season identifier (e.g., '2024', '21-22')
 
         Returns:
-            Dictionary with season metadata
+            Season with group ID and size estimates
 
         Raises:
             KeyError: If season not found
@@ -131,6 +125,41 @@ class RLCSManager:
 
         return cls.SEASONS[season_key]
 
+    @classmethod
+    def load_seasons_from_s3(cls, s3_manager: S3Manager) -> int:
+        """
+        Merge the season table stored at SEASONS_S3_KEY over the bundled SEASONS.
+
+        Entries in S3 replace bundled seasons with the same key and add new ones.
+        The merged table is kept on the class for the rest of the process. A
+        missing or malformed table leaves the bundled seasons in place. Unknown
+        fields in an entry are ignored, and an entry that still cannot be read
+        is skipped on its own.
+
+        Args:
+            s3_manager: S3Manager for the bucket holding the table
+
+        Returns:
+            Number of seasons loaded from S3
+        """
+        data = s3_manager.get_json(cls.SEASONS_S3_KEY)
+        if not data:
+            return 0
+
+        if not isinstance(data, dict):
+            print(f"Warning: Ignoring malformed season table at {cls.SEASONS_S3_KEY}")
+            return 0
+
+        remote = {}
+        for key, entry in data.items():
+            try:
+                remote[key] = Season(**{k: v for k, v in entry.items() if k in _SEASON_FIELDS})
+            except (AttributeError, TypeError) as e:
+                print(f"Warning: Skipping malformed season '{key}' in {cls.SEASONS_S3_KEY}: {e}")
+
+        cls.SEASONS = MappingProxyType({**cls.SEASONS, **remote})
+        return len(remote)
+
     @classmethod
     def get_available_seasons(cls) -> List[str]:
         """
@@ -150,31 +179,37 @@ class RLCSManager:
         """
         season = self.get_season_info(season_key)
 
-        print("=" * 60)
-        print(f"RLCS {season_key} Season Download")
-        print("=" * 60)
-        print(f"Season Name: {season['name']}")
-        print(f"Group ID: {season['group_id']}")
-        print(f"Estimated Replays: {season['estimated_replay_count']:,}")
-        print(f"Estimated Size: {season['estimated_size_gb']:.1f} GB")
-        print(f"Active Season: {season['is_active']} (as of {season['last_updated']})")
-        print()
+        rule = "=" * 60
+        print(
+            f"{rule}\n"
+            f"RLCS {season_key} Season Download\n"
+            f"{rule}\n"
+            f"Season Name: {season.name}\n"
+            f"Group ID: {season.group_id}\n"
+            f"Estimated Replays: {season.estimated_replay_count:,}\n"
+            f"Estimated Size: {season.estimated_size_gb:.1f} GB\n"
+            f"Active Season: {season.is_active} (as of {season.last_updated})\n"
+        )
 
     def list_seasons(self) -> None:
         """Print information about all available seasons."""
-        print()
-        print("=" * 60)
-        print("Available RLCS Seasons:")
-        for season_key, season_data in self.SEASONS.items():
-            print(f"\n  Season Key: {season_key}")
-            print(f"  Season Name: {season_data['name']}")
-            print(f"  Group ID: {season_data['group_id']}")
-            print(f"  Estimated replay count: {season_data['estimated_replay_count']:,} replays")
-            print(f"  Estimated total download size: {season_data['estimated_size_gb']:.1f} GB")
-            print(f"  Active Season: {season_data['is_active']} (as of {season_data['last_updated']})")
-        print("\nUse download_season(season_key) to download a specific season.")
-        print()
-        print("=" * 60)
+        rule = "=" * 60
+        seasons = "".join(
+            f"\n  Season Key: {season_key}\n"
+            f"  Season Name: {season.name}\n"
+            f"  Group ID: {season.group_id}\n"
+            f"  Estimated replay count: {season.estimated_replay_count:,} replays\n"
+            f"  Estimated total download size: {season.estimated_size_gb:.1f} GB\n"
+            f"  Active Season: {season.is_active} (as of {season.last_updated})\n"
+            for season_key, season in self.SEASONS.items()
+        )
+        print(
+            f"\n{rule}\n"
+            f"Available RLCS Seasons:\n"
+            f"{seasons}"
+            f"\nUse download_season(season_key) to download a specific season.\n"
+            f"\n{rule}"
+        )
 
     def download_season(
         self,
@@ -197,13 +232,6 @@ class RLCSManager:
         Returns:
             Download result object if successful, None if cancelled/dry-run
         """
-        # Validate season
-        try:
-            season = self.get_season_info(season_key)
-        except KeyError as e:
-            print(f"✗ {e}")
-            return None
-
         # Determine storage configuration
         storage = storage_type or self.storage_type
         out_dir = output_dir or self.output_dir
@@ -211,6 +239,21 @@ class RLCSManager:
         if storage == 'local' and not out_dir:
             raise ValueError("output_dir is required for local storage")
 
+        # Pick up seasons published to the bucket since this release. Read-only:
+        # the S3Backend (which creates the bucket) is only built after confirmation
+        if storage == 's3':
+            try:
+                self.load_seasons_from_s3(S3Manager())
+            except Exception as e:
+                print(f"Warning: Could not load season table from S3: {e}")
+
+        # Validate season
+        try:
+            season = self.get_season_info(season_key)
+        except KeyError as e:
+            print(f"✗ {e}")
+            return None
+
         # Print season info
         self.print_season_info(season_key)
 
@@ -225,8 +268,8 @@ class RLCSManager:
 
         # Confirm with user
         if confirm:
-            print(f"WARNING: This will download {season['estimated_replay_count']} replays to {storage} storage."
-                  f"Estimated download size: {season['estimated_size_gb']:.1f} GB!")
+            print(f"WARNING: This will download {season.estimated_replay_count} replays to {storage} storage."
+                  f"Estimated download size: {season.estimated_size_gb:.1f} GB!")
             if storage == 's3':
                 print("Make sure you're running on EC2 (not locally)")
             print()
@@ -248,7 +291,7 @@ class RLCSManager:
             # Download based on storage type
             if storage == 'local':
                 result = download_group(
-                    group_id=season['group_id'],
+                    group_id=season.group_id,
                     storage_type='local',
                     output_dir=out_dir,
                     use_database=self.use_database,
@@ -257,7 +300,7 @@ class RLCSManager:
             else:  # s3
                 path_prefix = self.path_prefix + [season_key]
                 result = download_group(
-                    group_id=season['group_id'],
+                    group_id=season.group_id,
                     storage_type='s3',
                     path_prefix=path_prefix,
                     use_database=self.use_database,
@@ -271,7 +314,7 @@ class RLCSManager:
             self._print_completion_summary(start_time, end_time, duration, result)
 
             # Save completion log
-            log_file = self._save_completion_log(
+            log_file, log_bytes = self._save_completion_log(
                 season_key, season, start_time, end_time, duration, result
             )
 
@@ -279,7 +322,14 @@ class RLCSManager:
             if storage == 's3':
                 try:
                     s3_backend = S3Backend()
-                    s3_backend.s3_manager.upload_file(log_file, f"logs/{log_file}")
+                    # Upload the serialized log from memory rather than re-reading the
+                    # file, gzipped (the indented JSON is mostly repeated keys)
+                    upload = s3_backend.s3_manager.upload_bytes(
+                        gzip.compress(log_bytes), f"logs/{log_file}.gz",
+                        extra_args={'ContentEncoding': 'gzip', 'ContentType': 'application/json'}
+                    )
+                    if not upload['success']:
+                        raise Exception(upload.get('error', 'upload failed'))
                     print(f"Log backed up to S3")
                 except Exception as e:
                     print(f"Warning: Could not upload log to S3: {e}")
@@ -304,39 +354,40 @@ class RLCSManager:
         result: Any
     ) -> None:
         """Print download completion summary."""
-        print()
-        print("=" * 60)
-        print("DOWNLOAD COMPLETE")
-        print("=" * 60)
-        print(f"Started: {start_time.isoformat()}")
-        print(f"Finished: {end_time.isoformat()}")
-        print(f"Duration: {duration}")
-        print()
-        print(f"Total replays: {result.total_replays}")
-        print(f"Successfully uploaded: {result.successful}")
-        print(f"Skipped: {result.skipped}")
-        print(f"Failed: {result.failed}")
-        print(f"Total size: {result.total_bytes / (1024**3):.2f} GB")
-        print()
+        rule = "=" * 60
+        print(
+            f"\n{rule}\n"
+            f"DOWNLOAD COMPLETE\n"
+            f"{rule}\n"
+            f"Started: {start_time.isoformat()}\n"
+            f"Finished: {end_time.isoformat()}\n"
+            f"Duration: {duration}\n"
+            f"\n"
+            f"Total replays: {result.total_replays}\n"
+            f"Successfully uploaded: {result.successful}\n"
+            f"Skipped: {result.skipped}\n"
+            f"Failed: {result.failed}\n"
+            f"Total size: {result.total_bytes / (1024**3):.2f} GB\n"
+        )
 
     def _save_completion_log(
         self,
         season_key: str,
-        season: Dict[str, Any],
+        season: Season,
         start_time: datetime,
         end_time: datetime,
         duration: Any,
         result: Any
-    ) -> str:
+    ) -> Tuple[str, bytes]:
         """
         Save download completion log to JSON file.
 
         Returns:
-            Path to saved log file
+            Tuple of (path to saved log file, serialized log contents)
         """
         log_entry = {
             'season': season_key,
-            'group_id': season['group_id'],
+            'group_id': season.group_id,
             'started': start_time.isoformat(),
             'finished': end_time.isoformat(),
             'duration_seconds': duration.total_seconds(),
@@ -352,8 +403,8 @@ class RLCSManager:
         }
 
         log_file = f"download_log_{season_key}_{start_time.strftime('%Y%m%d_%H%M%S')}.json"
-        with open(log_file, 'w') as f:
-            json.dump(log_entry, f, indent=2)
+        log_bytes = dumps_json(log_entry, indent=True)
+        Path(log_file).write_bytes(log_bytes)
 
         print(f"\nLog saved: {log_file}")
-        return log_file
+        return log_file, log_bytes
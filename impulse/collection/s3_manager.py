@@ -3,47 +3,151 @@ S3 Module for Impulse
 Handles all S3 operations including streaming replay uploads and database backups
 """
 
-from dotenv import load_dotenv
 import os
+import threading
 import boto3
-from typing import Dict, BinaryIO
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, BinaryIO, Iterable, Iterator, List, Optional, Tuple
+from itertools import islice
 from pathlib import Path
 import io
+import json
+
+from impulse.config.collection_config import load_env
+
+
+# Clients and transfer managers shared by every S3Manager in the process with the
+# same region and pool size
+_shared_clients: Dict[Tuple[str, int], Any] = {}
+_shared_transfers: Dict[Tuple[str, int], Any] = {}
+_shared_clients_lock = threading.Lock()
+
+# Buckets already confirmed to exist in this process
+_known_buckets = set()
+
+# Error codes S3 returns for a missing bucket or key (HEAD requests carry no
+# body, so those report the bare HTTP status)
+_NOT_FOUND_CODES = frozenset({'404', 'NoSuchKey', 'NoSuchBucket', 'NotFound'})
+
+
+def _shared_client(aws_region: str, max_pool_connections: int):
+    """
+    Return the process-wide S3 client for a region and connection pool size.
+
+    Building a client re-reads the endpoint data and resolves credentials, and
+    each one keeps its own connection pool; sharing one (boto3 clients are
+    thread-safe) lets repeated S3Manager instances reuse warm connections.
+    """
+    key = (aws_region, max_pool_connections)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            # The pool must hold a connection per worker or upload threads queue on
+            # it. Adaptive retries back off client-side when S3 throttles
+            # (503 SlowDown); keepalive stops idle pooled connections from being
+            # dropped during long runs.
+            client_config = Config(
+                max_pool_connections=max_pool_connections,
+                retries={'mode': 'adaptive', 'max_attempts': 10},
+                tcp_keepalive=True
+            )
+            client = boto3.client('s3', region_name=aws_region, config=client_config)
+            _shared_clients[key] = client
+        return client
+
+
+def _shared_transfer_manager(aws_region: str, max_pool_connections: int, transfer_config: TransferConfig):
+    """
+    Return the process-wide transfer manager over the shared client of the same key.
+
+    A transfer manager owns executor threads that are never shut down, so one
+    per S3Manager instance would leak them; it is thread-safe and shared
+    instead, like the client it wraps.
+    """
+    client = _shared_client(aws_region, max_pool_connections)
+    key = (aws_region, max_pool_connections)
+    with _shared_clients_lock:
+        transfer = _shared_transfers.get(key)
+        if transfer is None:
+            transfer = create_transfer_manager(client, transfer_config)
+            _shared_transfers[key] = transfer
+        return transfer
 
 
 class S3Manager:
     """Manages S3 uploads, downloads, and database backups"""
-    
-    def __init__(self, aws_region: str = None, s3_bucket_name: str = None):
+
+    # Default number of concurrent uploads in upload_many()
+    DEFAULT_MAX_WORKERS = 32
+
+    # Multipart settings for single-object transfers: objects above 16 MB (database
+    # backups) move in 16 MB parts/ranges, at least 16 at a time; replays stay
+    # single-part
+    TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=16 * 1024 * 1024,
+        multipart_chunksize=16 * 1024 * 1024,
+        max_concurrency=16,
+        use_threads=True,
+        max_io_queue=1000
+    )
+
+    def __init__(self, aws_region: str = None, s3_bucket_name: str = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS, verify: bool = False):
         """
         Initialize S3 manager with bucket and region info.
-        Automatically detects EC2 (IAM role) vs local (credentials).
+        On EC2 the IAM role is used; locally, configured credentials.
         
         Args:
             aws_region: AWS region (default: from .env)
             s3_bucket_name: S3 bucket name (default: from .env)
+            max_workers: Concurrent uploads in upload_many(); the client's
+                         connection pool is sized to match
+            verify: If True, check the credentials with a list_buckets() call and
+                    report whether they come from an EC2 IAM role or local config.
+                    Off by default to save the round-trip.
         """
         self.aws_region = aws_region if aws_region else self._get_env_var("AWS_REGION")
         self.s3_bucket_name = s3_bucket_name if s3_bucket_name else self._get_env_var("S3_BUCKET_NAME")
+        self.max_workers = max_workers
         
         # Initialize S3 client
         # On EC2: Uses IAM role automatically
         # Local: Uses credentials from ~/.aws/credentials or environment variables
         try:
-            self.s3_client = boto3.client('s3', region_name=self.aws_region)
+            # Size the pool for whichever runs more requests at once: upload_many()
+            # workers or the parts of one multipart transfer
+            pool_size = max(max_workers, self.TRANSFER_CONFIG.max_concurrency)
+            self.s3_client = _shared_client(self.aws_region, pool_size)
             
-            # Test credentials by trying to list buckets
-            self.s3_client.list_buckets()
+            # One long-lived transfer manager per client, shared by every instance
+            # (client.upload_fileobj() and friends build and tear down a manager
+            # and its thread pools on each call). Its request slots are shared by
+            # all concurrent transfers, so it gets the full pool.
+            self._transfer = _shared_transfer_manager(self.aws_region, pool_size, TransferConfig(
+                multipart_threshold=self.TRANSFER_CONFIG.multipart_threshold,
+                multipart_chunksize=self.TRANSFER_CONFIG.multipart_chunksize,
+                max_concurrency=pool_size,
+                use_threads=True,
+                max_io_queue=self.TRANSFER_CONFIG.max_io_queue
+            ))
             
-            # Determine if we're on EC2 or local
-            session = boto3.Session()
-            credentials = session.get_credentials()
-            if credentials:
-                # Check if it's an assumed role (EC2) or user credentials (local)
-                if hasattr(credentials, 'method') and credentials.method == 'iam-role':
-                    print(f"✓ S3 Manager initialized (EC2 IAM Role)")
-                else:
-                    print(f"✓ S3 Manager initialized (Local Credentials)")
+            if verify:
+                # Test credentials by trying to list buckets
+                self.s3_client.list_buckets()
+                
+                # Determine if we're on EC2 or local
+                credentials = boto3.Session().get_credentials()
+                if credentials:
+                    # Check if it's an assumed role (EC2) or user credentials (local)
+                    if hasattr(credentials, 'method') and credentials.method == 'iam-role':
+                        print(f"✓ S3 Manager initialized (EC2 IAM Role)")
+                    else:
+                        print(f"✓ S3 Manager initialized (Local Credentials)")
+            else:
+                print(f"✓ S3 Manager initialized")
             
             print(f"  Region: {self.aws_region}")
             print(f"  Bucket: {self.s3_bucket_name}")
@@ -60,7 +164,7 @@ class S3Manager:
     
     def _get_env_var(self, key: str) -> str:
         """Load environment variable from .env"""
-        load_dotenv()
+        load_env()
         value = os.environ.get(key)
         if not value:
             raise ValueError(f"{key} not found in environment variables")
@@ -71,12 +175,15 @@ class S3Manager:
         try:
             self.s3_client.head_bucket(Bucket=self.s3_bucket_name)
             return True
-        except:
-            return False
+        except ClientError as e:
+            if e.response['Error']['Code'] in _NOT_FOUND_CODES:
+                return False
+            raise
     
     def create_bucket_if_needed(self) -> None:
-        """Create S3 bucket if it doesn't exist"""
-        if self.bucket_exists():
+        """Create S3 bucket if it doesn't exist (checked once per process)"""
+        if self.s3_bucket_name in _known_buckets or self.bucket_exists():
+            _known_buckets.add(self.s3_bucket_name)
             print(f"✓ Bucket {self.s3_bucket_name} exists")
             return
         
@@ -89,12 +196,14 @@ class S3Manager:
                     Bucket=self.s3_bucket_name,
                     CreateBucketConfiguration={'LocationConstraint': self.aws_region}
                 )
+            _known_buckets.add(self.s3_bucket_name)
             print(f"✓ Bucket created successfully")
         except Exception as e:
             print(f"✗ Failed to create bucket: {e}")
             raise
     
-    def upload_fileobj(self, file_obj: BinaryIO, s3_key: str, metadata: Dict = None) -> Dict:
+    def upload_fileobj(self, file_obj: BinaryIO, s3_key: str, metadata: Dict = None,
+                       file_size: int = None, extra_args: Dict = None) -> Dict:
         """
         Upload a file object (in-memory) to S3.
         This is the core method to stream replay data directly from Ballchasing to S3, bypassing the need to first download locally to disk.
@@ -103,29 +212,37 @@ class S3Manager:
             file_obj: File-like object (BytesIO or similar)
             s3_key: S3 object key (path within bucket)
             metadata: Optional metadata dict to attach to object
+            file_size: Size in bytes, if the caller already knows it. The object
+                       is then uploaded from its current position without probing.
+            extra_args: Optional extra S3 upload arguments (e.g. ContentType,
+                        ContentEncoding)
             
         Returns:
             Dict with upload info (s3_key, size, etc.)
         """
         try:
             # Prepare upload kwargs
-            extra_args = {}
+            extra_args = dict(extra_args) if extra_args else {}
             if metadata:
                 # S3 metadata must be strings
                 extra_args['Metadata'] = {k: str(v) for k, v in metadata.items()}
             
             # Get file size
-            file_obj.seek(0, 2)  # Seek to end
-            file_size = file_obj.tell()
-            file_obj.seek(0)  # Seek back to start
+            if file_size is None:
+                if isinstance(file_obj, io.BytesIO):
+                    file_size = file_obj.getbuffer().nbytes
+                else:
+                    file_obj.seek(0, 2)  # Seek to end
+                    file_size = file_obj.tell()
+                file_obj.seek(0)  # Upload from the start
             
             # Upload directly from memory to S3
-            self.s3_client.upload_fileobj(
+            self._transfer.upload(
                 file_obj,
                 self.s3_bucket_name,
                 s3_key,
-                ExtraArgs=extra_args if extra_args else None
-            )
+                extra_args=extra_args if extra_args else None
+            ).result()
             
             return {
                 's3_key': s3_key,
@@ -142,7 +259,26 @@ class S3Manager:
                 'success': False
             }
     
-    def upload_bytes(self, data: bytes, s3_key: str, metadata: Dict = None) -> Dict:
+    def upload_many(
+        self,
+        items: Iterable[Tuple[BinaryIO, str, Optional[Dict]]],
+        max_workers: int = None
+    ) -> List[Dict]:
+        """
+        Upload many file objects to S3 concurrently.
+
+        Args:
+            items: (file_obj, s3_key, metadata) tuples; may be a lazy iterator
+            max_workers: Concurrent uploads (default: the instance's max_workers)
+
+        Returns:
+            List of upload_fileobj() result dicts, in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as pool:
+            return list(pool.map(lambda item: self.upload_fileobj(*item), items))
+    
+    def upload_bytes(self, data: bytes, s3_key: str, metadata: Dict = None,
+                     extra_args: Dict = None) -> Dict:
         """
         Upload raw bytes to S3 (convenience wrapper around upload_fileobj).
         
@@ -150,12 +286,13 @@ class S3Manager:
             data: Raw bytes
             s3_key: S3 object key
             metadata: Optional metadata
+            extra_args: Optional extra S3 upload arguments
             
         Returns:
             Dict with upload info
         """
-        file_obj = io.BytesIO(data)
-        return self.upload_fileobj(file_obj, s3_key, metadata)
+        return self.upload_fileobj(io.BytesIO(data), s3_key, metadata, file_size=len(data),
+                                   extra_args=extra_args)
     
     def upload_file(self, local_path: str, s3_key: str, metadata: Dict = None) -> Dict:
         """
@@ -171,7 +308,9 @@ class S3Manager:
         """
         try:
             path = Path(local_path)
-            if not path.exists():
+            try:
+                file_size = path.stat().st_size
+            except FileNotFoundError:
                 return {
                     's3_key': s3_key,
                     'error': f"File not found: {local_path}",
@@ -182,17 +321,20 @@ class S3Manager:
             if metadata:
                 extra_args['Metadata'] = {k: str(v) for k, v in metadata.items()}
             
-            self.s3_client.upload_file(
+            # Uploading by filename lets each transfer thread read its own part
+            # straight from disk; a file object would be read part by part on one
+            # thread and buffered in memory first
+            self._transfer.upload(
                 str(path),
                 self.s3_bucket_name,
                 s3_key,
-                ExtraArgs=extra_args if extra_args else None
-            )
+                extra_args=extra_args if extra_args else None
+            ).result()
             
             return {
                 's3_key': s3_key,
                 'bucket': self.s3_bucket_name,
-                'size_bytes': path.stat().st_size,
+                'size_bytes': file_size,
                 'success': True
             }
             
@@ -218,55 +360,113 @@ class S3Manager:
             path = Path(local_path)
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            self.s3_client.download_file(
+            # Objects above the multipart threshold (database backups) are fetched
+            # as parallel byte-range GETs instead of one streaming connection
+            self._transfer.download(
                 self.s3_bucket_name,
                 s3_key,
                 str(path)
-            )
+            ).result()
             return True
             
         except Exception as e:
             print(f"✗ Download failed: {e}")
             return False
     
+    def get_json(self, s3_key: str, default: Any = None) -> Any:
+        """
+        Fetch and parse a JSON object from S3.
+        
+        Args:
+            s3_key: S3 object key
+            default: Returned when the object doesn't exist
+            
+        Returns:
+            Parsed JSON value, or default if the key is missing
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.s3_bucket_name, Key=s3_key)
+        except ClientError as e:
+            if e.response['Error']['Code'] in _NOT_FOUND_CODES:
+                return default
+            raise
+        return json.loads(response['Body'].read())
+    
     def object_exists(self, s3_key: str) -> bool:
         """Check if an object exists in S3"""
         try:
             self.s3_client.head_object(Bucket=self.s3_bucket_name, Key=s3_key)
             return True
-        except:
-            return False
+        except ClientError as e:
+            if e.response['Error']['Code'] in _NOT_FOUND_CODES:
+                return False
+            raise
     
     def get_object_size(self, s3_key: str) -> int:
-        """Get size of an S3 object in bytes"""
+        """Get size of an S3 object in bytes (0 if it doesn't exist)"""
         try:
             response = self.s3_client.head_object(Bucket=self.s3_bucket_name, Key=s3_key)
             return response['ContentLength']
-        except:
-            return 0
+        except ClientError as e:
+            if e.response['Error']['Code'] in _NOT_FOUND_CODES:
+                return 0
+            raise
     
-    def list_objects(self, prefix: str = "", max_keys: int = 1000) -> list:
+    def preload_existing(self, prefix: str = "") -> set:
+        """
+        Collect every key under a prefix in one paginated listing.
+        
+        Checking many keys against the returned set costs one LIST request per
+        1000 objects instead of one HEAD request per key.
+        
+        Args:
+            prefix: S3 key prefix to list (e.g., "replays/rlcs/2024/")
+            
+        Returns:
+            Set of object keys
+        """
+        return set(self.iter_objects(prefix))
+    
+    def _iter_contents(self, prefix: str) -> Iterator[Dict]:
+        """Yield the listing entry (Key, Size, ...) of each object under a prefix, one page at a time"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.s3_bucket_name,
+            Prefix=prefix,
+            PaginationConfig={'PageSize': 1000}
+        )
+        for page in pages:
+            yield from page.get('Contents', ())
+    
+    def iter_objects(self, prefix: str = "") -> Iterator[str]:
+        """
+        Lazily iterate over object keys under a prefix.
+        
+        Pages are fetched as the iterator is consumed, so memory stays constant and
+        a caller that stops early skips the remaining LIST requests.
+        
+        Args:
+            prefix: S3 key prefix to filter (e.g., "replays/worlds-2024/")
+            
+        Yields:
+            Object keys
+        """
+        for obj in self._iter_contents(prefix):
+            yield obj['Key']
+    
+    def list_objects(self, prefix: str = "", max_keys: Optional[int] = None) -> list:
         """
         List objects in S3 with given prefix.
         
         Args:
             prefix: S3 key prefix to filter (e.g., "replays/worlds-2024/")
-            max_keys: Maximum number of keys to return
+            max_keys: Maximum number of keys to return (default: all)
             
         Returns:
             List of object keys
         """
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.s3_bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys
-            )
-            
-            if 'Contents' not in response:
-                return []
-            
-            return [obj['Key'] for obj in response['Contents']]
+            return list(islice(self.iter_objects(prefix), max_keys))
             
         except Exception as e:
             print(f"✗ List objects failed: {e}")
@@ -342,14 +542,9 @@ class S3Manager:
             total_size = 0
             count = 0
             
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.s3_bucket_name, Prefix=prefix)
-            
-            for page in pages:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        total_size += obj['Size']
-                        count += 1
+            for obj in self._iter_contents(prefix):
+                total_size += obj['Size']
+                count += 1
             
             return {
                 'total_objects': count,
@@ -168,9 +168,10 @@ class LocalBackend(StorageBackend):
     def get_replay_size(self, replay_id: str, path_components: List[str]) -> int:
         """Get replay file size."""
         filepath = self.base_dir / Path(*path_components) / f"{replay_id}.replay"
-        if filepath.exists():
+        try:
             return filepath.stat().st_size
-        return 0
+        except FileNotFoundError:
+            return 0
 
     def list_replays(self, path_prefix: List[str]) -> List[str]:
         """List all replay IDs under a path prefix."""
@@ -242,6 +243,11 @@ class S3Backend(StorageBackend):
 
         self.bucket_name = self.s3_manager.s3_bucket_name
 
+        # Keys under each replay directory, listed on first lookup so existence
+        # checks cost one LIST per directory instead of one HEAD per replay.
+        # Uploads through this backend are added as they succeed.
+        self._known_keys: Dict[str, set] = {}
+
     def save_replay(self, replay_id: str, data: bytes, path_components: List[str],
                    metadata: Optional[Dict] = None) -> Dict:
         """Save replay to S3."""
@@ -251,12 +257,20 @@ class S3Backend(StorageBackend):
         # Upload to S3
         result = self.s3_manager.upload_bytes(data, s3_key, metadata)
 
+        if result['success']:
+            known = self._known_keys.get('/'.join(path_components) + '/')
+            if known is not None:
+                known.add(s3_key)
+
         return result
 
     def replay_exists(self, replay_id: str, path_components: List[str]) -> bool:
-        """Check if replay exists in S3."""
-        s3_key = '/'.join(path_components) + f'/{replay_id}.replay'
-        return self.s3_manager.object_exists(s3_key)
+        """Check if replay exists in S3 (against a cached listing of its directory)."""
+        prefix = '/'.join(path_components) + '/'
+        known = self._known_keys.get(prefix)
+        if known is None:
+            known = self._known_keys[prefix] = self.s3_manager.preload_existing(prefix)
+        return f'{prefix}{replay_id}.replay' in known
 
     def get_replay_size(self, replay_id: str, path_components: List[str]) -> int:
         """Get replay file size from S3."""
@@ -268,7 +282,7 @@ class S3Backend(StorageBackend):
         prefix = '/'.join(path_prefix) + '/' if path_prefix else ''
 
         # Get all objects with this prefix
-        objects = self.s3_manager.list_objects(prefix, max_keys=10000)
+        objects = self.s3_manager.list_objects(prefix)
 
         # Extract replay IDs
         replay_ids = []
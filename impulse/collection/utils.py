@@ -7,7 +7,12 @@ common tasks used across the collection module.
 
 import json
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
 
 
 def sanitize_path_component(name: str) -> str:
@@ -262,3 +267,22 @@ def delete_group_tree_cache(group_id: str, cache_dir: Optional[Path] = None) ->
         return True
 
     return False
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON, using orjson when installed.
+
+    orjson also encodes NumPy arrays and scalars; the stdlib fallback does not.
+
+    Args:
+        obj: JSON-serializable object
+        indent: If True, indent with two spaces
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode()
@@ -6,11 +6,18 @@ Supports both environment-based and programmatic configuration for testing.
 """
 
 from dotenv import load_dotenv
+import functools
 import os
 from typing import Optional
 from dataclasses import dataclass
 
 
+@functools.cache
+def load_env() -> None:
+    """Load the project's .env file into os.environ (parsed once per process)."""
+    load_dotenv()
+
+
 @dataclass
 class CollectionConfig:
     """
@@ -50,7 +57,7 @@ class CollectionConfig:
         Raises:
             ValueError: If required environment variables are missing
         """
-        load_dotenv()
+        load_env()
 
         ballchasing_api_key = os.environ.get("BALLCHASING_API_KEY")
         if not ballchasing_api_key:
@@ -3,7 +3,7 @@ Configuration file for parsing using subtr_actor.
 Purpose: handle extraction settings for parsing.  
 """
 
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Tuple
 
 # Valid feature adders from subtr-actor documentation for 
 #       subtr_actor.get_ndarray_with_info_from_replay_filepath() 
@@ -148,6 +148,17 @@ VALID_FEATURE_ADDERS = {
     }
 }
 
+# Immutable per-adder column tuples and name sets, precomputed once at import so
+# validation and schema lookups are single hash hits rather than list scans.
+GLOBAL_ADDER_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    name: tuple(cols) for name, cols in VALID_FEATURE_ADDERS['global'].items()
+}
+PLAYER_ADDER_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    name: tuple(cols) for name, cols in VALID_FEATURE_ADDERS['player'].items()
+}
+GLOBAL_ADDER_NAMES: FrozenSet[str] = frozenset(GLOBAL_ADDER_COLUMNS)
+PLAYER_ADDER_NAMES: FrozenSet[str] = frozenset(PLAYER_ADDER_COLUMNS)
+
 # Feature presets for common parsing use cases.
 FEATURE_PRESETS = {
     # Standard: Basic game and player state, ball/player positions, rotations, velocities.
@@ -233,23 +244,20 @@ class ParsingConfig:
         Raises:
             ValueError: If any feature name is invalid
         """
-        valid_global = set(VALID_FEATURE_ADDERS['global'].keys())
-        valid_player = set(VALID_FEATURE_ADDERS['player'].keys())
-        
-        for feature in global_features:
-            if feature not in valid_global:
-                raise ValueError(
-                    f"Invalid global feature '{feature}'. "
-                    f"Valid options: {sorted(valid_global)}"
-                )
-        
-        for feature in player_features:
-            if feature not in valid_player:
-                raise ValueError(
-                    f"Invalid player feature '{feature}'. "
-                    f"Valid options: {sorted(valid_player)}"
-                )
-    
+        invalid_global = [f for f in global_features if f not in GLOBAL_ADDER_NAMES]
+        if invalid_global:
+            raise ValueError(
+                f"Invalid global features {invalid_global}. "
+                f"Valid options: {sorted(GLOBAL_ADDER_NAMES)}"
+            )
+
+        invalid_player = [f for f in player_features if f not in PLAYER_ADDER_NAMES]
+        if invalid_player:
+            raise ValueError(
+                f"Invalid player features {invalid_player}. "
+                f"Valid options: {sorted(PLAYER_ADDER_NAMES)}"
+            )
+
     @classmethod
     def get_column_names(cls, feature_adder_name: str, feature_adder_type: str) -> List[str]:
         """Get returned column names for a feature adder.
@@ -267,11 +275,12 @@ class ParsingConfig:
         if feature_adder_type not in ['global', 'player']:
             raise ValueError(f"feature_adder_type must be 'global' or 'player', got '{feature_adder_type}'")
 
-        valid_adders = VALID_FEATURE_ADDERS[feature_adder_type]
-        if feature_adder_name not in valid_adders:
+        adder_columns = GLOBAL_ADDER_COLUMNS if feature_adder_type == 'global' else PLAYER_ADDER_COLUMNS
+        columns = adder_columns.get(feature_adder_name)
+        if columns is None:
             raise ValueError(
                 f"Feature adder '{feature_adder_name}' not found in {feature_adder_type} features. "
-                f"Valid options: {sorted(valid_adders.keys())}"
+                f"Valid options: {sorted(adder_columns)}"
             )
 
-        return valid_adders[feature_adder_name]
+        return list(columns)
@@ -13,7 +13,9 @@ class PipelineConfig:
     """
     
     # Parquet storage configuration
-    PARQUET_COMPRESSION: str = 'snappy'
+    PARQUET_COMPRESSION: str = 'zstd'
+    PARQUET_COMPRESSION_LEVEL: int = 3   # zstd only; other codecs use their defaults
+    PARQUET_FLOAT_DTYPE: str = 'float32'  # Float columns are stored at this precision
     S3_RAW_PREFIX: str = 'replays/raw'
     S3_PARSED_PREFIX: str = 'replays/parsed'
 
@@ -18,7 +18,7 @@ import numpy as np
 import pandas as pd
 from impulse.parsing.replay_parser import ParseResult
 from impulse.config.pipeline_config import PipelineConfig
-from impulse.config.parsing_config import VALID_FEATURE_ADDERS
+from impulse.config.parsing_config import GLOBAL_ADDER_COLUMNS, PLAYER_ADDER_COLUMNS
 
 
 @dataclass
@@ -98,19 +98,23 @@ class ParseResultFormatter:
         if parse_result.num_players > config.MAX_PLAYERS:
             return False, [f"Too many players: {parse_result.num_players} > {config.MAX_PLAYERS}"], validation_info
 
-        # NaN detection (warning only)
-        if np.isnan(parse_result.array).any():
-            nan_count = int(np.isnan(parse_result.array).sum())
-            validation_info['has_nan'] = True
-            validation_info['nan_count'] = nan_count
-            warnings.append(f"Array contains {nan_count} NaN values")
+        # NaN/Inf detection (warning only). One isfinite pass covers the common
+        # all-finite case; NaNs are only counted separately when something is off.
+        array = parse_result.array
+        non_finite_count = array.size - int(np.count_nonzero(np.isfinite(array)))
+        if non_finite_count:
+            nan_count = int(np.count_nonzero(np.isnan(array)))
+            inf_count = non_finite_count - nan_count
 
-        # Inf detection (warning only)
-        if np.isinf(parse_result.array).any():
-            inf_count = int(np.isinf(parse_result.array).sum())
-            validation_info['has_inf'] = True
-            validation_info['inf_count'] = inf_count
-            warnings.append(f"Array contains {inf_count} Inf values")
+            if nan_count:
+                validation_info['has_nan'] = True
+                validation_info['nan_count'] = nan_count
+                warnings.append(f"Array contains {nan_count} NaN values")
+
+            if inf_count:
+                validation_info['has_inf'] = True
+                validation_info['inf_count'] = inf_count
+                warnings.append(f"Array contains {inf_count} Inf values")
 
         # Column count validation (warning only)
         if parse_result.global_features and parse_result.player_features:
@@ -142,12 +146,12 @@ class ParseResultFormatter:
             Expected number of columns in output array
         """
         global_cols = sum(
-            len(VALID_FEATURE_ADDERS['global'][feat])
+            len(GLOBAL_ADDER_COLUMNS[feat])
             for feat in global_features
         )
 
         player_cols = sum(
-            len(VALID_FEATURE_ADDERS['player'][feat])
+            len(PLAYER_ADDER_COLUMNS[feat])
             for feat in player_features
         )
 
@@ -303,7 +307,7 @@ class ParseResultFormatter:
         seen_columns: set = set()
         ndarray_idx = 0
 
-        def process_feature(raw_cols: List[str], prefix: str = '') -> None:
+        def process_feature(raw_cols: Tuple[str, ...], prefix: str = '') -> None:
             nonlocal ndarray_idx
             for raw_col in raw_cols:
                 full_col = f"{prefix}{raw_col}" if prefix else raw_col
@@ -321,11 +325,11 @@ class ParseResultFormatter:
                 ndarray_idx += 1
 
         for feature in global_features:
-            process_feature(VALID_FEATURE_ADDERS['global'][feature])
+            process_feature(GLOBAL_ADDER_COLUMNS[feature])
 
         for player_idx in range(num_players):
             for feature in player_features:
-                process_feature(VALID_FEATURE_ADDERS['player'][feature], prefix=f'p{player_idx}_')
+                process_feature(PLAYER_ADDER_COLUMNS[feature], prefix=f'p{player_idx}_')
 
         return np.column_stack(output_data), output_columns
 
@@ -6,17 +6,20 @@ Coordinates ReplayParser and ParseResultFormatter with database registration.
 """
 
 import dataclasses
-import json
 import logging
 import tempfile
+import zlib
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import pandas as pd
 
 from impulse.parsing.replay_parser import ReplayParser, ParseResult
 from impulse.parsing.parse_result_formatter import ParseResultFormatter, FormatResult
 from impulse.collection.database import ImpulseDB
+from impulse.collection.utils import dumps_json
 from impulse.config.parsing_config import ParsingConfig
 from impulse.config.pipeline_config import PipelineConfig
 from impulse.preprocessing.segmentation import find_segment_boundaries, serialize_boundaries
@@ -192,11 +195,16 @@ class ParsingPipeline:
             output_path.mkdir(parents=True, exist_ok=True)
 
             parquet_file = output_path / f"{format_result.replay_id}.parquet"
-            format_result.dataframe.to_parquet(parquet_file, compression=compression, index=False)
+            write_kwargs = {}
+            if compression == 'zstd':
+                write_kwargs['compression_level'] = PipelineConfig.PARQUET_COMPRESSION_LEVEL
+            self._downcast_floats(format_result.dataframe).to_parquet(
+                parquet_file, compression=compression, index=False, **write_kwargs
+            )
 
             metadata_file = output_path / f"{format_result.replay_id}.metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(format_result.metadata, f, indent=2)
+            with open(metadata_file, 'wb') as f:
+                f.write(dumps_json(format_result.metadata, indent=True))
 
             return dataclasses.replace(
                 format_result,
@@ -209,6 +217,19 @@ class ParsingPipeline:
         except Exception as e:
             return dataclasses.replace(format_result, success=False, error=f"Save failed: {str(e)}")
 
+    def _downcast_floats(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast float64 columns to PipelineConfig.PARQUET_FLOAT_DTYPE for storage.
+
+        Positions, velocities, and rotations need far less than float64 precision,
+        so storing them as float32 halves file size and downstream memory traffic.
+        Integer columns (e.g. 'frame') are left unchanged.
+        """
+        float64_cols = df.select_dtypes('float64').columns
+        if len(float64_cols) == 0:
+            return df
+        return df.astype({col: PipelineConfig.PARQUET_FLOAT_DTYPE for col in float64_cols})
+
     def parse_replay(
         self,
         replay_path: str,
@@ -300,7 +321,7 @@ class ParsingPipeline:
 
         # Register in database
         if self.db:
-            metadata_json = json.dumps(format_result.metadata) if format_result.metadata else None
+            metadata_json = dumps_json(format_result.metadata).decode() if format_result.metadata else None
             self.db.add_parsed_replay(
                 replay_id=replay_id,
                 raw_replay_id=replay_id,
@@ -396,7 +417,8 @@ class ParsingPipeline:
         output_dir: str,
         raw_replays_dir: Optional[str] = None,
         limit: Optional[int] = None,
-        compression: str = PipelineConfig.PARQUET_COMPRESSION
+        compression: str = PipelineConfig.PARQUET_COMPRESSION,
+        shard: Optional[Tuple[int, int]] = None
     ) -> PipelineResult:
         """
         Parse all downloaded replays that haven't been parsed yet.
@@ -412,8 +434,13 @@ class ParsingPipeline:
             output_dir: Directory to save parsed output files
             raw_replays_dir: Local directory containing raw .replay files.
                              Required when s3_manager is not configured.
-            limit: Maximum number of replays to parse (None for all)
+            limit: Maximum number of replays to parse (None for all). Applied
+                   before sharding.
             compression: Parquet compression algorithm
+            shard: Optional (shard_index, num_shards). Only replays whose ID hashes
+                   to shard_index are parsed, so num_shards processes can split
+                   the backlog without coordinating. The split depends only on
+                   the replay ID, so it stays disjoint as other shards progress.
 
         Returns:
             PipelineResult with statistics
@@ -431,6 +458,13 @@ class ParsingPipeline:
 
         unparsed = self.db.get_unparsed_replays(limit=limit)
 
+        if shard:
+            shard_index, num_shards = shard
+            unparsed = [
+                r for r in unparsed
+                if zlib.crc32(r['replay_id'].encode()) % num_shards == shard_index
+            ]
+
         if not unparsed:
             print("No unparsed replays found.")
             return PipelineResult(
@@ -614,7 +648,8 @@ class ParsingPipeline:
         Resolve local file paths for a list of replay records.
 
         Tries storage_key-based path first, then {replay_id}.replay, then a
-        recursive glob as a last resort.
+        recursive search as a last resort. The directory tree is walked at most
+        once per call, on the first replay that needs the fallback.
 
         Args:
             replay_infos: List of replay info dicts
@@ -626,6 +661,7 @@ class ParsingPipeline:
         """
         raw_dir = Path(raw_replays_dir)
         replay_paths = []
+        files_by_id = None  # replay ID -> first .replay file found under raw_dir
 
         for replay_info in replay_infos:
             replay_id = replay_info[id_key]
@@ -643,9 +679,11 @@ class ParsingPipeline:
                     replay_path = candidate
 
             if not replay_path:
-                matches = list(raw_dir.rglob(f"{replay_id}.replay"))
-                if matches:
-                    replay_path = matches[0]
+                if files_by_id is None:
+                    files_by_id = {}
+                    for path in raw_dir.rglob("*.replay"):
+                        files_by_id.setdefault(path.stem, path)
+                replay_path = files_by_id.get(replay_id)
 
             if replay_path:
                 replay_paths.append(str(replay_path))
@@ -5,17 +5,46 @@ Wraps the subtr-actor library to parse Rocket League replay files.
 Handles the complexity of calling subtr-actor and extracting structured data from replays.
 """
 
-from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 import subtr_actor
-from impulse.config.parsing_config import ParsingConfig, FEATURE_PRESETS
+from impulse.config.parsing_config import (
+    ParsingConfig,
+    FEATURE_PRESETS,
+    GLOBAL_ADDER_COLUMNS,
+    PLAYER_ADDER_COLUMNS,
+)
 
+logger = logging.getLogger('impulse.parsing')
 
-@dataclass
+# Bump whenever the cached array/metadata layout changes to invalidate old entries.
+CACHE_SCHEMA_VERSION = 2
+
+
+@dataclass(slots=True)
 class ParseResult:
-    """Result of parsing a replay file."""
+    """
+    Result of parsing a replay file.
+
+    The array is stored as float32. Replay positions and velocities carry at most
+    ~5 significant digits, well within float32's ~7, and float32 halves memory
+    and bandwidth for every downstream operation.
+
+    Uses __slots__ to keep per-instance overhead low when many results are held
+    in memory during batch parsing.
+
+    When the result comes from the parse cache, the array is a read-only memory
+    map. Pages are read lazily by the OS; call .copy() before mutating it.
+    """
     success: bool
     replay_path: str
     metadata: Optional[Dict[str, Any]]
@@ -27,7 +56,8 @@ class ParseResult:
     global_features: Optional[List[str]] = None
     player_features: Optional[List[str]] = None
     error: Optional[str] = None
-    
+    _tensor: Any = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def duration_seconds(self) -> float:
         """Calculate replay duration in seconds."""
@@ -35,6 +65,80 @@ class ParseResult:
             return self.num_frames / self.fps
         return 0.0
 
+    def as_torch(self, pin: bool = False):
+        """
+        Return the array as a PyTorch tensor, converting once and memoizing.
+
+        The tensor shares memory with self.array. Read-only arrays (cache-hit
+        memory maps) are copied first, since torch requires writable memory.
+
+        Args:
+            pin: Pin the tensor in page-locked memory for async host-to-GPU
+                 copies (tensor.to('cuda', non_blocking=True)). Requires CUDA.
+
+        Returns:
+            torch.Tensor of shape (num_frames, num_features)
+
+        Raises:
+            ValueError: If the parse failed
+            ImportError: If PyTorch is not installed
+        """
+        if not self.success or self.array is None:
+            raise ValueError(f"Cannot convert a failed parse: {self.error}")
+
+        if self._tensor is None:
+            try:
+                import torch
+            except ImportError:
+                raise ImportError(
+                    "PyTorch is required for ParseResult.as_torch. "
+                    "Install with: pip install impulse[training]  or  uv sync --extra training"
+                )
+            array = self.array if self.array.flags.writeable else np.array(self.array)
+            self._tensor = torch.from_numpy(array)
+
+        if pin and not self._tensor.is_pinned():
+            self._tensor = self._tensor.pin_memory()
+        return self._tensor
+
+    def entity_views(self) -> Dict[str, np.ndarray]:
+        """
+        Split the array into per-entity column blocks without copying.
+
+        subtr-actor lays out all global feature columns first, followed by one
+        fixed-width block of player feature columns per player. This returns
+        zero-copy views into the parsed array for each block:
+
+            {'global': (frames, n_global_cols),
+             'player_0': (frames, n_player_cols), 'player_1': ..., ...}
+
+        The views share memory with self.array (AoS storage, SoA access).
+
+        Returns:
+            Dict mapping entity name to an ndarray view
+
+        Raises:
+            ValueError: If the parse failed or the array width does not match
+                        the feature adder column counts
+        """
+        if not self.success or self.array is None:
+            raise ValueError(f"Cannot split a failed parse: {self.error}")
+
+        num_global_cols = sum(len(GLOBAL_ADDER_COLUMNS[f]) for f in self.global_features or [])
+        num_player_cols = sum(len(PLAYER_ADDER_COLUMNS[f]) for f in self.player_features or [])
+        expected_cols = num_global_cols + num_player_cols * self.num_players
+        if self.array.shape[1] != expected_cols:
+            raise ValueError(
+                f"Array has {self.array.shape[1]} columns, expected {expected_cols} "
+                f"for {self.num_players} players"
+            )
+
+        views = {'global': self.array[:, :num_global_cols]}
+        for player_idx in range(self.num_players):
+            start = num_global_cols + player_idx * num_player_cols
+            views[f'player_{player_idx}'] = self.array[:, start:start + num_player_cols]
+        return views
+
 
 class ReplayParser:
     """
@@ -43,7 +147,13 @@ class ReplayParser:
     This class wraps the subtr-actor library and provides a clean interface for parsing replay files with specified features at a given frame sampling rate.
     """
     
-    def __init__(self, global_features: List[str], player_features: List[str], fps: float = ParsingConfig.DEFAULT_FPS):
+    def __init__(
+        self,
+        global_features: List[str],
+        player_features: List[str],
+        fps: float = ParsingConfig.DEFAULT_FPS,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize the replay parser.
         
@@ -51,6 +161,9 @@ class ReplayParser:
             global_features: List of global feature adders (e.g., 'BallRigidBody')
             player_features: List of player feature adders (e.g., 'PlayerBoost')
             fps: Frames per second to sample at
+            cache_dir: Optional directory for caching parse output. When set, results
+                       are keyed by a hash of the replay file contents, parser features,
+                       and FPS, so re-parsing an unchanged replay skips subtr-actor.
             
         Raises:
             ValueError: If feature adders are invalid or FPS is out of range
@@ -68,15 +181,25 @@ class ReplayParser:
         self.global_features = global_features
         self.player_features = player_features
         self.fps = fps
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     @classmethod
-    def from_preset(cls, preset_name: str, fps: float = ParsingConfig.DEFAULT_FPS) -> "ReplayParser":
+    def from_preset(
+        cls,
+        preset_name: str,
+        fps: float = ParsingConfig.DEFAULT_FPS,
+        cache_dir: Optional[str] = None
+    ) -> "ReplayParser":
         """
         Create parser from a feature preset.
         
         Args:
             preset_name: Name of preset ('minimal', 'standard', 'all')
             fps: Frames per second to sample at
+            cache_dir: Optional directory for caching parse output
             
         Returns:
             ReplayParser instance
@@ -88,7 +211,8 @@ class ReplayParser:
         return cls(
             global_features=preset['global'],
             player_features=preset['player'],
-            fps=fps
+            fps=fps,
+            cache_dir=cache_dir
         )
     
     def parse_file(self, replay_path: str) -> ParseResult:
@@ -101,10 +225,18 @@ class ReplayParser:
         Returns:
             ParseResult with parsed data or error information
         """
-        replay_path = str(Path(replay_path).resolve())
-        
-        # Check file exists
-        if not Path(replay_path).exists():
+        replay_path = os.path.abspath(replay_path)
+
+        # Check file exists (a single stat; no symlink resolution). Any OSError
+        # (missing file, a parent that is a file, no permission) fails just this
+        # replay rather than raising out of parse_files()
+        try:
+            os.stat(replay_path)
+        except OSError as e:
+            if isinstance(e, FileNotFoundError):
+                error = f"File not found: {replay_path}"
+            else:
+                error = f"Cannot access {replay_path}: {e}"
             return ParseResult(
                 success=False,
                 replay_path=replay_path,
@@ -116,17 +248,31 @@ class ReplayParser:
                 fps=self.fps,
                 global_features=self.global_features,
                 player_features=self.player_features,
-                error=f"File not found: {replay_path}"
+                error=error
             )
         
         try:
-            # Call subtr-actor
-            metadata, array = subtr_actor.get_ndarray_with_info_from_replay_filepath(
-                replay_path,
-                self.global_features,
-                self.player_features,
-                self.fps
-            )
+            # The cache is keyed by file content, read with a single large read
+            cache_key = None
+            if self.cache_dir:
+                with open(replay_path, 'rb', buffering=0) as f:
+                    cache_key = self._cache_key(f.read())
+            cached = self._load_cached(cache_key) if cache_key else None
+
+            if cached is not None:
+                metadata, array = cached
+            else:
+                # Call subtr-actor
+                metadata, array = subtr_actor.get_ndarray_with_info_from_replay_filepath(
+                    replay_path,
+                    self.global_features,
+                    self.player_features,
+                    self.fps
+                )
+                if array is not None and array.dtype == np.float64:
+                    array = array.astype(np.float32, copy=False)
+                if cache_key and self._validate_parse_result(array) is None:
+                    self._store_cached(cache_key, metadata, array)
             
             # Extract player count from metadata
             num_players = self._count_players(metadata)
@@ -176,6 +322,120 @@ class ReplayParser:
                 error=f"Parsing failed: {str(e)}"
             )
     
+    def parse_files(
+        self,
+        replay_paths: List[str],
+        max_workers: Optional[int] = None,
+        use_processes: bool = True
+    ) -> List[ParseResult]:
+        """
+        Parse multiple replay files in parallel.
+
+        Replays are independent, so by default they are parsed in a process pool
+        (each worker builds its own parser once). Threads only help if
+        subtr-actor releases the GIL while parsing, which has not been
+        measured; pass use_processes=False to use a thread pool instead.
+
+        Args:
+            replay_paths: Paths to .replay files
+            max_workers: Number of workers (default: os.cpu_count())
+            use_processes: Use a process pool (default) rather than a thread pool
+
+        Returns:
+            List of ParseResult, in the same order as replay_paths
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+
+        if use_processes:
+            # Spawn rather than fork: callers are often multithreaded (thread
+            # pools, cached S3 clients), and forking those can deadlock the child
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_parser,
+                initargs=(
+                    list(self.global_features), list(self.player_features),
+                    self.fps, str(self.cache_dir) if self.cache_dir else None
+                )
+            ) as executor:
+                return list(executor.map(_parse_in_worker, replay_paths))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.parse_file, replay_paths))
+
+    def _cache_key(self, replay_bytes: bytes) -> str:
+        """
+        Compute the cache key for a replay file.
+
+        Hashes the file contents together with the cache schema version, FPS, and
+        the ordered feature adder lists (order determines column layout).
+
+        Args:
+            replay_bytes: Raw contents of the .replay file
+
+        Returns:
+            Hex digest identifying this replay/parser configuration
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(replay_bytes)
+        digest.update(
+            f"v{CACHE_SCHEMA_VERSION}|{self.fps}|"
+            f"{','.join(self.global_features)}|{','.join(self.player_features)}".encode()
+        )
+        return digest.hexdigest()
+
+    def _load_cached(self, cache_key: str) -> Optional[Tuple[Dict[str, Any], np.ndarray]]:
+        """
+        Load a cached parse result, or None on a cache miss.
+
+        The array is memory-mapped read-only, so a hit costs almost no copying.
+        """
+        array_path = self.cache_dir / f"{cache_key}.npy"
+        metadata_path = self.cache_dir / f"{cache_key}.metadata.json"
+        if not (array_path.exists() and metadata_path.exists()):
+            return None
+
+        try:
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            array = np.load(array_path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {cache_key}: {e}")
+            return None
+
+        return metadata, array
+
+    def _store_cached(self, cache_key: str, metadata: Dict[str, Any], array: np.ndarray) -> None:
+        """
+        Write a parse result to the cache.
+
+        Each file is written to a temp file and atomically renamed into place, so
+        concurrent or interrupted writers never leave a partial entry behind.
+        Failures are logged and otherwise ignored — caching is best-effort.
+        """
+        try:
+            self._atomic_write(
+                self.cache_dir / f"{cache_key}.npy",
+                lambda f: np.save(f, np.ascontiguousarray(array))
+            )
+            self._atomic_write(
+                self.cache_dir / f"{cache_key}.metadata.json",
+                lambda f: f.write(json.dumps(metadata).encode())
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write parse cache entry {cache_key}: {e}")
+
+    def _atomic_write(self, path: Path, write) -> None:
+        """Call write(file) on a temp file in path's directory, then rename it to path."""
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
     def _count_players(self, metadata: Dict[str, Any]) -> int:
         """
         Extract player count from metadata.
@@ -211,3 +471,23 @@ class ReplayParser:
             return "Array has zero frames or features"
 
         return None
+
+
+# Per-process parser used by ReplayParser.parse_files(use_processes=True)
+_worker_parser: Optional[ReplayParser] = None
+
+
+def _init_worker_parser(
+    global_features: List[str],
+    player_features: List[str],
+    fps: float,
+    cache_dir: Optional[str]
+) -> None:
+    """Process pool initializer: build one parser per worker process."""
+    global _worker_parser
+    _worker_parser = ReplayParser(global_features, player_features, fps, cache_dir=cache_dir)
+
+
+def _parse_in_worker(replay_path: str) -> ParseResult:
+    """Process pool task: parse a single replay with the worker's parser."""
+    return _worker_parser.parse_file(replay_path)
@@ -0,0 +1,60 @@
+"""
+Optional Numba-compiled kernels for kickoff setup detection.
+
+Numba is not a required dependency. When it is installed, `frame_ranges` and
+`boundaries_from_mask` are JIT-compiled single forward scans (cached on disk
+after the first compile); otherwise both are None and callers fall back to the
+vectorized NumPy implementations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def frame_ranges(idx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns (starts, ends) arrays of the continuous runs in a sorted, non-empty int64 index array."""
+        n = idx.shape[0]
+        starts = np.empty(n, np.int64)
+        ends = np.empty(n, np.int64)
+        k = 0
+        start = idx[0]
+        for i in range(1, n):
+            if idx[i] != idx[i - 1] + 1:
+                starts[k] = start
+                ends[k] = idx[i - 1]
+                k += 1
+                start = idx[i]
+        starts[k] = start
+        ends[k] = idx[n - 1]
+        k += 1
+        return starts[:k], ends[:k]
+
+    @njit(cache=True, boundscheck=False)
+    def boundaries_from_mask(mask: np.ndarray, min_len: int) -> tuple[np.ndarray, np.ndarray]:
+        """Returns (starts, ends_exclusive) arrays of the non-empty runs of False in a kickoff row mask that are at least min_len long."""
+        n = mask.shape[0]
+        starts = np.empty(n // 2 + 1, np.int64)
+        ends = np.empty(n // 2 + 1, np.int64)
+        k = 0
+        i = 0
+        while i < n:
+            if mask[i]:
+                i += 1
+                continue
+            start = i
+            while i < n and not mask[i]:
+                i += 1
+            if i - start >= min_len:
+                starts[k] = start
+                ends[k] = i
+                k += 1
+        return starts[:k], ends[:k]
+else:
+    frame_ranges = None
+    boundaries_from_mask = None
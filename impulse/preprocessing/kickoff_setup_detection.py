@@ -2,40 +2,68 @@
 
 Since the ball sits motionless at the center of the field during the kickoff setup, detection of kickoff setup frames is based on detecting continuous ranges of frames where the ball's position and velocity in the x and y directions are all zero.
 
-The functions in this module can be used to identify these ranges of frames in a replay and return them as a list of tuples containing the start and end frame indices of each range.
+The functions in this module can be used to identify these ranges of frames in a replay and return them as a structured array of `(start, end)` records (dtype `KICKOFF_RANGE_DTYPE`) holding the start and end frame indices of each range. Records index like tuples (`r[0]`, `r[1]`), and `ranges['start']`/`ranges['end']` give vectorized views of all starts/ends; `ranges.tolist()` converts to a list of tuples.
 
 Note: One might notice that `Ball - position z` is never equal to `0.0`, but is typically `92.75`(for kickoff frames) and occasionally is a little higher; moreover, for the rows where `Ball - position z > 92.75`, we have that `Ball - linear velocity z` is nonzero. The z-coordinate of `92.75` is explained by the radius of the ball and the fact that its coordinates are the coordinates for its center. The nonzero values of the z-component of linear velocity and the values of the ball's z-coordinates greater than its radius are explained by the fact when the game resets to the kickoff setup configuration, it places the ball (and each of the players' cars) ever so slightly above the ground so that they have a subtle drop-in effect."""
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
+from impulse.preprocessing._kickoff_numba import frame_ranges as _numba_frame_ranges
+
 BALL_POS_X_Y_COLS = ['Ball - position x', 'Ball - position y']
 BALL_LINVEL_X_Y_COLS = ['Ball - linear velocity x', 'Ball - linear velocity y']
 BALL_POS_VEL_Z_COLS = ['Ball - position z', 'Ball - linear velocity z']
 BALL_POS_VEL_X_Y_COLS = BALL_POS_X_Y_COLS + BALL_LINVEL_X_Y_COLS
 BALL_POS_VEL_COLS = BALL_POS_VEL_X_Y_COLS + BALL_POS_VEL_Z_COLS
 
+KICKOFF_RANGE_DTYPE = np.dtype([('start', np.int64), ('end', np.int64)])
+
+@lru_cache(maxsize=32)
+def _column_positions(columns: tuple[str, ...], wanted: tuple[str, ...]) -> np.ndarray:
+    """Returns the integer positions of the wanted columns within a frames schema (memoized per schema)."""
+    positions = {name: i for i, name in enumerate(columns)}
+    return np.array([positions[col] for col in wanted], dtype=np.intp)
+
+def kickoff_row_mask(frames: pd.DataFrame) -> np.ndarray:
+    """Returns a boolean mask of the rows where the ball's x/y position and velocity are all zero."""
+    positions = _column_positions(tuple(frames.columns), tuple(BALL_POS_VEL_X_Y_COLS))
+    return ~np.any(frames.iloc[:, positions].to_numpy(), axis=1)
+
+def _index_ranges(idx: np.ndarray) -> np.ndarray:
+    """Returns the (start, end) records of runs of consecutive integers in a sorted int64 index array."""
+    if idx.size == 0:
+        return np.empty(0, dtype=KICKOFF_RANGE_DTYPE)
+
+    if _numba_frame_ranges is not None:
+        starts, ends = _numba_frame_ranges(idx)
+    else:
+        # A new range starts wherever consecutive frame indices are not adjacent
+        break_positions = np.flatnonzero(np.diff(idx) != 1)
+        starts = np.concatenate(([idx[0]], idx[break_positions + 1]))
+        ends = np.concatenate((idx[break_positions], [idx[-1]]))
+
+    ranges = np.empty(starts.size, dtype=KICKOFF_RANGE_DTYPE)
+    ranges['start'] = starts
+    ranges['end'] = ends
+    return ranges
+
 def kickoff_setup_frames(frames: pd.DataFrame) -> pd.DataFrame:
     """Returns a DataFrame containing the frames of the kickoff setup."""
-    kickoff_setup_frames = frames[BALL_POS_VEL_COLS]
-    boolean_mask = kickoff_setup_frames[BALL_POS_VEL_X_Y_COLS] == 0.0
-    rows_where_true = boolean_mask.all(axis=1)
-    kickoff_setup_frames = kickoff_setup_frames.loc[kickoff_setup_frames.index[rows_where_true]]
-
-    return kickoff_setup_frames
-
-def continuous_frame_ranges(kickoff_setup_frames: pd.DataFrame) -> list[tuple[int, int]]:
-    """Returns a list of tuples containing the start and end frame numbers of continuous frame ranges in the kickoff setup dataframe."""
-    cts_frame_ranges = []
-    
-    i = 0
-    for index in kickoff_setup_frames.index:
-        if i == 0:
-            start = index
-        elif index != kickoff_setup_frames.index[i-1] + 1:
-            cts_frame_ranges.append((start, int(kickoff_setup_frames.index[i-1])))
-            start = index
-        i+=1
-    cts_frame_ranges.append((start, int(kickoff_setup_frames.index[i-1])))
-
-    return cts_frame_ranges
-    
+    ball_pos_vel = frames.iloc[:, _column_positions(tuple(frames.columns), tuple(BALL_POS_VEL_COLS))].to_numpy()
+
+    # A row is a kickoff row iff none of the x/y position/velocity columns is nonzero
+    num_xy_cols = len(BALL_POS_VEL_X_Y_COLS)
+    row_mask = ~np.any(ball_pos_vel[:, :num_xy_cols], axis=1)
+
+    return pd.DataFrame(ball_pos_vel[row_mask], index=frames.index[row_mask], columns=BALL_POS_VEL_COLS)
+
+def continuous_frame_ranges(kickoff_setup_frames: pd.DataFrame) -> np.ndarray:
+    """Returns a KICKOFF_RANGE_DTYPE array of the start and end frame numbers of continuous frame ranges in the kickoff setup dataframe."""
+    return _index_ranges(np.asarray(kickoff_setup_frames.index, dtype=np.int64))
+
+def kickoff_row_ranges(frames: pd.DataFrame) -> np.ndarray:
+    """Returns the (start, end) row positions of each kickoff setup range. Unlike `continuous_frame_ranges`, these are positions (what `frames.iloc` takes), not index labels, so they hold for any index."""
+    return _index_ranges(np.flatnonzero(kickoff_row_mask(frames)).astype(np.int64, copy=False))
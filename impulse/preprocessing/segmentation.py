@@ -16,12 +16,23 @@ Usage:
 import json
 from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from impulse.preprocessing.kickoff_setup_detection import (
-    kickoff_setup_frames,
-    continuous_frame_ranges,
+    BALL_POS_VEL_X_Y_COLS,
+    kickoff_row_mask,
+    kickoff_row_ranges,
 )
+from impulse.preprocessing._kickoff_numba import boundaries_from_mask as _numba_boundaries_from_mask
+
+# Bump when kickoff detection or boundary rules change, to invalidate any
+# boundaries cached on disk.
+SEGMENTATION_VERSION = 2
+
+# The only columns find_segment_boundaries reads. Pass as `columns=` when loading
+# Parquet purely for segmentation so the other feature columns are never decoded.
+SEGMENTATION_COLUMNS = list(BALL_POS_VEL_X_Y_COLS)
 
 
 def find_segment_boundaries(
@@ -47,34 +58,32 @@ def find_segment_boundaries(
     """
     total_frames = len(frames)
 
-    ks_frames = kickoff_setup_frames(frames)
+    if _numba_boundaries_from_mask is not None:
+        # Compiled fast path: segments are exactly the runs of non-kickoff rows,
+        # so emit them straight from the row mask in one scan
+        starts, ends = _numba_boundaries_from_mask(kickoff_row_mask(frames), min_segment_frames)
+        return list(zip(starts.tolist(), ends.tolist()))
 
-    if ks_frames.empty:
+    # NumPy fallback. Row positions, like the compiled path, so a sliced or
+    # reindexed frame gives the same boundaries either way
+    kickoff_ranges = kickoff_row_ranges(frames)
+
+    if len(kickoff_ranges) == 0:
         # No kickoff resets — entire replay is one segment
         if total_frames >= min_segment_frames:
             return [(0, total_frames)]
         return []
 
-    kickoff_ranges = continuous_frame_ranges(ks_frames)
-
-    boundaries: List[Tuple[int, int]] = []
-
-    # First segment: frame 0 to start of first kickoff
-    boundaries.append((0, kickoff_ranges[0][0]))
-
-    # Middle segments: between consecutive kickoff ranges
-    for i in range(1, len(kickoff_ranges)):
-        seg_start = kickoff_ranges[i - 1][1] + 1
-        seg_end = kickoff_ranges[i][0]
-        boundaries.append((seg_start, seg_end))
-
-    # Last segment: after last kickoff to end of replay
-    last_kickoff_end = kickoff_ranges[-1][1] + 1
-    if last_kickoff_end < total_frames:
-        boundaries.append((last_kickoff_end, total_frames))
+    # Segments run from the end of each kickoff (or frame 0) to the start of the
+    # next kickoff (or the end of the replay). Built as two vectorized arrays.
+    starts = np.concatenate(([0], kickoff_ranges['end'] + 1))
+    ends = np.concatenate((kickoff_ranges['start'], [total_frames]))
 
-    # Filter by minimum length
-    return [(s, e) for s, e in boundaries if e - s >= min_segment_frames]
+    # Filter by minimum length, always dropping empty segments (e.g. when the
+    # replay starts or ends on a kickoff)
+    lengths = ends - starts
+    keep = (lengths >= min_segment_frames) & (lengths > 0)
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
 
 
 def serialize_boundaries(boundaries: List[Tuple[int, int]]) -> str:
@@ -11,20 +11,47 @@ Key classes:
 """
 
 import json
+import logging
+import os
 import random
 import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from impulse.preprocessing.segmentation import (
+    SEGMENTATION_COLUMNS,
+    SEGMENTATION_VERSION,
+    deserialize_boundaries,
+    find_segment_boundaries,
+    serialize_boundaries,
+)
 
 if TYPE_CHECKING:
     from impulse.collection.s3_manager import S3Manager
 
+logger = logging.getLogger('impulse.dataset')
+
+_INFO_COLUMNS = """
+    replay_id, output_path, fps, frame_count, feature_count,
+    file_size_bytes, parsed_at, metadata, segment_boundaries
+"""
+
+# Parsed replays that can be loaded. Shared by every query that lists replays,
+# so the full table load and the ID-only sampling path see the same set.
+_LOADABLE_WHERE = "parse_status = 'parsed' AND output_path IS NOT NULL AND output_path != ''"
+
+# Stay under SQLite's default bound-parameter limit (999) for WHERE ... IN (...)
+_SQLITE_MAX_PARAMS = 900
 
-@dataclass
+
+@dataclass(slots=True)
 class ReplayData:
     """
     A loaded replay with its frame data and metadata.
@@ -43,10 +70,39 @@ class ReplayData:
 
     def __getattr__(self, name: str) -> Any:
         """Allow accessing metadata fields as attributes."""
-        metadata = self.__dict__.get('metadata', {})
-        if metadata and name in metadata:
-            return metadata[name]
-        raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
+        # Only reached for names that are not slots/class attributes. Read the
+        # slot directly: it may be unset mid-construction or unpickling.
+        try:
+            return object.__getattribute__(self, 'metadata')[name]
+        except (AttributeError, KeyError, TypeError):
+            raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'") from None
+
+    def segment_arrays(
+        self,
+        boundaries: Optional[List[Tuple[int, int]]] = None,
+        columns: Optional[List[str]] = None,
+        dtype: np.dtype = np.float32,
+    ) -> List[np.ndarray]:
+        """
+        Return each gameplay segment as a 2D NumPy array.
+
+        The frames are converted to a single contiguous array once; each segment
+        is a zero-copy row slice (view) of it.
+
+        Args:
+            boundaries: (start, end_exclusive) pairs. Computed with
+                        find_segment_boundaries() if not provided.
+            columns: Columns to include, in order. None includes all columns.
+            dtype: Output dtype.
+
+        Returns:
+            List of arrays of shape (segment_length, num_columns).
+        """
+        if boundaries is None:
+            boundaries = find_segment_boundaries(self.frames)
+        frames = self.frames if columns is None else self.frames[columns]
+        arr = frames.to_numpy(dtype=dtype)
+        return [arr[start:end] for start, end in boundaries]
 
 
 class ReplayDataset:
@@ -68,6 +124,10 @@ class ReplayDataset:
         - __iter__(): Lazy iteration, one replay at a time (memory-efficient)
         - iter_batches(n): Batched iteration (large-scale processing)
 
+    Multi-replay loaders prefetch upcoming replays on a small thread pool so
+    Parquet reads overlap with the caller's processing. Results are always
+    yielded in the requested order.
+
     S3 support:
         When parsed files live on S3, provide an s3_manager. If cache_dir is
         also set, files are downloaded once and reused on subsequent accesses.
@@ -92,6 +152,10 @@ class ReplayDataset:
         data_dir: Optional[str] = None,
         s3_manager: Optional["S3Manager"] = None,
         cache_dir: Optional[str] = None,
+        num_workers: int = 4,
+        prefetch: int = 2,
+        recursive_scan: bool = True,
+        dtype_backend: Optional[str] = None,
     ):
         """
         Args:
@@ -102,11 +166,27 @@ class ReplayDataset:
             cache_dir: Local directory for caching S3 downloads. When set, files
                        downloaded from S3 are saved here and reused on subsequent
                        loads, avoiding redundant S3 requests.
+            num_workers: Threads used to load replays ahead of the consumer in
+                         iteration and bulk loads. 0 or 1 loads serially.
+            prefetch: Replays in flight per worker. Bounds the memory held by
+                      replays that are loaded but not yet consumed.
+            recursive_scan: In directory mode, also scan subdirectories of
+                            data_dir. Set False for flat layouts to list a
+                            single directory.
+            dtype_backend: Passed to pd.read_parquet. 'pyarrow' keeps frames
+                           Arrow-backed (pd.ArrowDtype columns): each column is
+                           one contiguous Arrow buffer and the Arrow-to-NumPy
+                           block consolidation step is skipped. None (default)
+                           gives NumPy-backed frames.
         """
         self.db_path = Path(db_path) if db_path else None
         self.data_dir = Path(data_dir) if data_dir else None
         self.s3_manager = s3_manager
         self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.num_workers = num_workers
+        self.prefetch = max(1, prefetch)
+        self.recursive_scan = recursive_scan
+        self.dtype_backend = dtype_backend
 
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -117,6 +197,11 @@ class ReplayDataset:
             raise ValueError("Must provide either db_path (existing) or data_dir")
 
         self._replay_info: Optional[Dict[str, Dict]] = None
+        self._replay_ids: Optional[Tuple[str, ...]] = None
+        # Rows fetched by ID before (or instead of) the full table load
+        self._partial_info: Dict[str, Dict] = {}
+        self._metadata_cache: Dict[str, Dict[str, Any]] = {}
+        self._boundaries_cache: Dict[Tuple[str, int], List[Tuple[int, int]]] = {}
 
     # -------------------------------------------------------------------------
     # Replay info loading
@@ -130,12 +215,15 @@ class ReplayDataset:
         return self._replay_info
 
     @property
-    def replay_ids(self) -> List[str]:
-        """List of available replay IDs."""
-        return list(self.replay_info.keys())
+    def replay_ids(self) -> Tuple[str, ...]:
+        """Available replay IDs (built once and cached; immutable)."""
+        if self._replay_ids is None:
+            self._replay_ids = tuple(self.replay_info.keys())
+        return self._replay_ids
 
     def _load_replay_info(self):
         self._replay_info = {}
+        self._replay_ids = None
         if self.use_db:
             self._load_from_db()
         else:
@@ -147,32 +235,108 @@ class ReplayDataset:
         conn.row_factory = sqlite3.Row
         try:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT replay_id, output_path, fps, frame_count, feature_count,
-                       file_size_bytes, parsed_at, metadata, segment_boundaries
+            cursor.execute(f"""
+                SELECT {_INFO_COLUMNS}
                 FROM parsed_replays
-                WHERE parse_status = 'parsed'
+                WHERE {_LOADABLE_WHERE}
             """)
             for row in cursor.fetchall():
                 row_dict = dict(row)
-                if row_dict.get('output_path'):
-                    self._replay_info[row_dict['replay_id']] = row_dict
+                self._replay_info[row_dict['replay_id']] = row_dict
+        finally:
+            conn.close()
+        logger.info(f"Found {len(self._replay_info)} parsed replays in database")
+
+    def _query_parsed_ids(self) -> List[str]:
+        """Fetch only the IDs of loadable parsed replays (no metadata columns)."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute(f"SELECT replay_id FROM parsed_replays WHERE {_LOADABLE_WHERE}")
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def _load_infos_for(self, replay_ids: List[str]):
+        """
+        Fetch info rows for just the given IDs, without loading the whole table.
+
+        Uses chunked WHERE replay_id IN (...) lookups on the primary key. Rows
+        are kept in _partial_info until (if ever) the full table is loaded.
+        """
+        missing = [rid for rid in replay_ids if rid not in self._partial_info]
+        if not missing:
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            for i in range(0, len(missing), _SQLITE_MAX_PARAMS):
+                chunk = missing[i:i + _SQLITE_MAX_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(f"""
+                    SELECT {_INFO_COLUMNS}
+                    FROM parsed_replays
+                    WHERE replay_id IN ({placeholders}) AND {_LOADABLE_WHERE}
+                """, chunk)
+                for row in cursor.fetchall():
+                    row_dict = dict(row)
+                    self._partial_info[row_dict['replay_id']] = row_dict
         finally:
             conn.close()
-        print(f"Found {len(self._replay_info)} parsed replays in database")
+
+    def _get_info(self, replay_id: str) -> Optional[Dict]:
+        """Info row for one replay, from the full table if loaded, else from rows fetched by ID."""
+        if self._replay_info is None and replay_id in self._partial_info:
+            return self._partial_info[replay_id]
+        return self.replay_info.get(replay_id)
+
+    def _sample_ids(self, n: int, seed: Optional[int]) -> List[str]:
+        """
+        Sample replay IDs. In database mode, if the full table has not been
+        loaded, only the ID column is queried and the sampled rows are fetched.
+
+        Candidates are sorted before seeding, so a seed picks the same replays
+        whichever path runs (and regardless of table or directory order).
+        """
+        lazy = self.use_db and self._replay_info is None
+        all_ids = sorted(self._query_parsed_ids() if lazy else self.replay_ids)
+
+        rng = random.Random(seed)
+        sampled = rng.sample(all_ids, min(n, len(all_ids)))
+        if lazy:
+            self._load_infos_for(sampled)
+        return sampled
 
     def _scan_directory(self):
         """Fallback: scan a directory for parquet files."""
-        for pq_file in self.data_dir.rglob("*.parquet"):
-            replay_id = pq_file.stem
+        for pq_path in self._iter_parquet_paths(str(self.data_dir)):
+            replay_id = os.path.basename(pq_path)[:-len('.parquet')]
             self._replay_info[replay_id] = {
                 'replay_id': replay_id,
-                'output_path': str(pq_file),
+                'output_path': pq_path,
                 'frame_count': None,
                 'feature_count': None,
                 'fps': None,
             }
-        print(f"Found {len(self._replay_info)} parquet files in {self.data_dir}")
+        logger.info(f"Found {len(self._replay_info)} parquet files in {self.data_dir}")
+
+    def _iter_parquet_paths(self, root: str) -> Iterator[str]:
+        """
+        Yield .parquet file paths under root using os.scandir.
+
+        scandir reports entry types from the directory listing itself, so no
+        per-file stat is needed. Subdirectories are descended only when
+        recursive_scan is set (symlinked directories are not followed).
+        """
+        with os.scandir(root) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.name.endswith('.parquet') and entry.is_file():
+                    yield entry.path
+                elif self.recursive_scan and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+        for subdir in subdirs:
+            yield from self._iter_parquet_paths(subdir)
 
     # -------------------------------------------------------------------------
     # Path resolution
@@ -220,41 +384,82 @@ class ReplayDataset:
                 cached = self.cache_dir / f"{replay_id}.parquet"
                 if self.s3_manager.download_file(s3_key, str(cached)):
                     return str(cached)
-                print(f"Warning: S3 download failed for {replay_id} ({s3_key})")
+                logger.warning(f"S3 download failed for {replay_id} ({s3_key})")
                 return None
             else:
                 # Stream directly — requires s3fs package
                 return f"s3://{self.s3_manager.s3_bucket_name}/{s3_key}"
 
-        print(f"Warning: Cannot locate parquet file for {replay_id}: {output_path}")
+        logger.warning(f"Cannot locate parquet file for {replay_id}: {output_path}")
         return None
 
     # -------------------------------------------------------------------------
     # Loading
     # -------------------------------------------------------------------------
 
-    def load_replay(self, replay_id: str) -> Optional[ReplayData]:
+    def load_replay(self, replay_id: str, columns: Optional[List[str]] = None) -> Optional[ReplayData]:
         """
         Load a single replay by ID.
 
+        Args:
+            replay_id: ID of the replay to load.
+            columns: Feature columns to read. None reads all columns. Projection
+                     happens in the Parquet reader, so unselected columns are
+                     never read or decompressed.
+
         Returns:
             ReplayData, or None if the replay cannot be found or loaded.
         """
-        if replay_id not in self.replay_info:
-            print(f"Warning: Replay {replay_id} not found in dataset")
+        info = self._get_info(replay_id)
+        if info is None:
+            logger.warning(f"Replay {replay_id} not found in dataset")
             return None
 
-        info = self.replay_info[replay_id]
         parquet_path = self._resolve_parquet_path(replay_id, info['output_path'])
         if parquet_path is None:
             return None
 
+        read_kwargs = {'dtype_backend': self.dtype_backend} if self.dtype_backend else {}
+        if not parquet_path.startswith('s3://'):
+            # Memory-map local files: the kernel pages in only the column chunks
+            # that get decoded, and concurrent readers share the page cache.
+            read_kwargs['memory_map'] = True
         try:
-            df = pd.read_parquet(parquet_path)
+            # pre_buffer coalesces column-chunk reads into one request per row
+            # group, which matters on S3/NFS and costs nothing on local disk.
+            df = pd.read_parquet(
+                parquet_path, columns=columns, engine='pyarrow',
+                pre_buffer=True, use_threads=True, **read_kwargs,
+            )
         except Exception as e:
-            print(f"Warning: Failed to load {replay_id}: {e}")
+            logger.warning(f"Failed to load {replay_id}: {e}")
             return None
 
+        # Files written before parquet output switched to float32 still hold
+        # float64; normalize so every loaded replay has the same width.
+        if self.dtype_backend == 'pyarrow':
+            wide, narrow = pd.ArrowDtype(pa.float64()), pd.ArrowDtype(pa.float32())
+        else:
+            wide, narrow = np.dtype(np.float64), np.dtype(np.float32)
+        float64_cols = df.columns[df.dtypes == wide]
+        if len(float64_cols):
+            df = df.astype({col: narrow for col in float64_cols})
+
+        metadata = dict(self._get_metadata(replay_id, info, parquet_path))
+
+        return ReplayData(replay_id=replay_id, frames=df, metadata=metadata)
+
+    def _get_metadata(self, replay_id: str, info: Dict, parquet_path: str) -> Dict[str, Any]:
+        """
+        Build the merged metadata dict for a replay, memoized per replay ID.
+
+        Combines DB columns, the DB metadata JSON, and the local JSON sidecar
+        (if present). Both JSON sources are parsed only on a replay's first load.
+        """
+        cached = self._metadata_cache.get(replay_id)
+        if cached is not None:
+            return cached
+
         metadata = {
             'replay_id': replay_id,
             'frame_count': info.get('frame_count'),
@@ -277,66 +482,105 @@ class ReplayDataset:
                 with open(sidecar) as f:
                     metadata.update(json.load(f))
 
-        return ReplayData(replay_id=replay_id, frames=df, metadata=metadata)
+        self._metadata_cache[replay_id] = metadata
+        return metadata
+
+    def _load_many(
+        self, replay_ids: List[str], columns: Optional[List[str]] = None
+    ) -> Iterator[Optional[ReplayData]]:
+        """
+        Load replays in order, prefetching up to num_workers * prefetch ahead.
+
+        Yields one result per ID (None for replays that failed to load).
+        """
+        if self.num_workers <= 1:
+            for replay_id in replay_ids:
+                yield self.load_replay(replay_id, columns)
+            return
+
+        # Populate replay_info before workers touch it concurrently (unless every
+        # requested row was already fetched by ID)
+        if self._replay_info is None and not all(rid in self._partial_info for rid in replay_ids):
+            self.replay_info
+
+        ids = iter(replay_ids)
+        executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        try:
+            pending = deque(
+                executor.submit(self.load_replay, replay_id, columns)
+                for _, replay_id in zip(range(self.num_workers * self.prefetch), ids)
+            )
+            while pending:
+                replay = pending.popleft().result()
+                next_id = next(ids, None)
+                if next_id is not None:
+                    pending.append(executor.submit(self.load_replay, next_id, columns))
+                yield replay
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-    def load_sample(self, n: int = 50, seed: Optional[int] = None) -> List[ReplayData]:
+    def load_sample(
+        self, n: int = 50, seed: Optional[int] = None, columns: Optional[List[str]] = None
+    ) -> List[ReplayData]:
         """
         Load a random sample of replays.
 
         Args:
             n: Number of replays to sample.
             seed: Random seed for reproducibility. Does not affect global random state.
+            columns: Feature columns to read (None for all). See load_replay().
 
         Returns:
             List of ReplayData objects.
         """
-        rng = random.Random(seed)
-        n = min(n, len(self.replay_ids))
-        sampled_ids = rng.sample(self.replay_ids, n)
+        sampled_ids = self._sample_ids(n, seed)
+        n = len(sampled_ids)
 
-        results = [r for rid in sampled_ids if (r := self.load_replay(rid)) is not None]
-        print(f"Loaded {len(results)}/{n} replays")
+        results = [r for r in self._load_many(sampled_ids, columns) if r is not None]
+        logger.info(f"Loaded {len(results)}/{n} replays")
         return results
 
-    def load_all(self) -> List[ReplayData]:
+    def load_all(self, columns: Optional[List[str]] = None) -> List[ReplayData]:
         """
         Load all replays into memory.
 
         Only suitable for small datasets. For large collections use __iter__(),
         iter_batches(), or WindowedReplayDataset instead.
+
+        Args:
+            columns: Feature columns to read (None for all). See load_replay().
         """
         n = len(self)
         if n > 500:
-            print(f"Warning: loading {n} replays into memory. "
-                  "For large datasets, prefer __iter__() or iter_batches().")
+            logger.warning(f"Loading {n} replays into memory. "
+                           "For large datasets, prefer __iter__() or iter_batches().")
 
-        results = [r for rid in self.replay_ids if (r := self.load_replay(rid)) is not None]
-        print(f"Loaded {len(results)}/{n} replays")
+        results = [r for r in self._load_many(self.replay_ids, columns) if r is not None]
+        logger.info(f"Loaded {len(results)}/{n} replays")
         return results
 
     def __len__(self) -> int:
-        return len(self.replay_ids)
+        return len(self.replay_info)
 
     def __iter__(self) -> Iterator[ReplayData]:
         """Iterate over all replays lazily, one at a time."""
-        for replay_id in self.replay_ids:
-            replay = self.load_replay(replay_id)
-            if replay is not None:
-                yield replay
+        return self.iter_ids(self.replay_ids)
 
-    def iter_batches(self, batch_size: int = 100) -> Iterator[List[ReplayData]]:
+    def iter_batches(
+        self, batch_size: int = 100, columns: Optional[List[str]] = None
+    ) -> Iterator[List[ReplayData]]:
         """
         Iterate over replays in batches. Only one batch is held in memory at a time.
 
         Args:
             batch_size: Number of replays per batch.
+            columns: Feature columns to read (None for all). See load_replay().
 
         Yields:
             Lists of ReplayData objects.
         """
         batch = []
-        for replay_id in self.replay_ids:
-            replay = self.load_replay(replay_id)
+        for replay in self._load_many(self.replay_ids, columns):
             if replay is not None:
                 batch.append(replay)
                 if len(batch) >= batch_size:
@@ -345,18 +589,20 @@ class ReplayDataset:
         if batch:
             yield batch
 
-    def iter_ids(self, replay_ids: List[str]) -> Iterator[ReplayData]:
+    def iter_ids(
+        self, replay_ids: List[str], columns: Optional[List[str]] = None
+    ) -> Iterator[ReplayData]:
         """
         Iterate over a specific subset of replay IDs, loading lazily.
 
         Args:
             replay_ids: List of replay IDs to iterate over.
+            columns: Feature columns to read (None for all). See load_replay().
 
         Yields:
             ReplayData objects for each successfully loaded replay.
         """
-        for replay_id in replay_ids:
-            replay = self.load_replay(replay_id)
+        for replay in self._load_many(replay_ids, columns):
             if replay is not None:
                 yield replay
 
@@ -366,7 +612,7 @@ class ReplayDataset:
 
     def get_replay_info(self, replay_id: str) -> Optional[Dict]:
         """Get replay metadata from DB without loading the parquet file."""
-        return self.replay_info.get(replay_id)
+        return self._get_info(replay_id)
 
     def sample_replay_ids(self, n: int, seed: Optional[int] = None) -> List[str]:
         """
@@ -376,9 +622,55 @@ class ReplayDataset:
             n: Number of IDs to sample.
             seed: Random seed. Does not affect global random state.
         """
-        rng = random.Random(seed)
-        n = min(n, len(self.replay_ids))
-        return rng.sample(self.replay_ids, n)
+        return self._sample_ids(n, seed)
+
+    def get_segment_boundaries(
+        self, replay_id: str, min_segment_frames: int = 10
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Get a replay's segment boundaries, computing them only when not cached.
+
+        Lookup order:
+          1. In-memory cache for (replay_id, min_segment_frames)
+          2. Boundaries stored in the DB (computed at parse time with the
+             default min_segment_frames=10)
+          3. cache_dir/segments/{replay_id}.min{N}.v{SEGMENTATION_VERSION}.json
+          4. Compute from the ball columns only (column-projected load) and
+             write to the on-disk cache if cache_dir is set
+
+        Returns:
+            List of (start, end_exclusive) tuples, or None if the replay
+            cannot be loaded.
+        """
+        key = (replay_id, min_segment_frames)
+        if key in self._boundaries_cache:
+            return self._boundaries_cache[key]
+
+        info = self._get_info(replay_id) or {}
+        boundaries = None
+        if min_segment_frames == 10 and info.get('segment_boundaries'):
+            boundaries = deserialize_boundaries(info['segment_boundaries'])
+
+        cache_file = None
+        if boundaries is None and self.cache_dir:
+            cache_file = (
+                self.cache_dir / 'segments'
+                / f"{replay_id}.min{min_segment_frames}.v{SEGMENTATION_VERSION}.json"
+            )
+            if cache_file.exists():
+                boundaries = deserialize_boundaries(cache_file.read_text())
+
+        if boundaries is None:
+            replay = self.load_replay(replay_id, columns=SEGMENTATION_COLUMNS)
+            if replay is None:
+                return None
+            boundaries = find_segment_boundaries(replay.frames, min_segment_frames)
+            if cache_file is not None:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(serialize_boundaries(boundaries))
+
+        self._boundaries_cache[key] = boundaries
+        return boundaries
 
     def get_frame_count_summary(self) -> Dict[str, Any]:
         """
@@ -389,11 +681,15 @@ class ReplayDataset:
         if not self.use_db:
             return {'error': 'Frame count summary requires database mode'}
 
-        counts = np.array([
-            info['frame_count']
-            for info in self.replay_info.values()
-            if info.get('frame_count') is not None
-        ])
+        # Single pass straight into an int64 buffer, no intermediate list
+        counts = np.fromiter(
+            (
+                info['frame_count']
+                for info in self.replay_info.values()
+                if info.get('frame_count') is not None
+            ),
+            dtype=np.int64,
+        )
 
         if len(counts) == 0:
             return {'error': 'No frame count data available'}
@@ -153,6 +153,9 @@ class ReplayTrainingDataset(Dataset):
 
         Shape: (window_size, num_features) for fixed windows,
                (segment_length, num_features) for variable-length.
+
+        The window is copied out of the cached replay array, so in-place
+        transforms on the returned tensor cannot corrupt later windows.
         """
         replay_id, start, end = self._index[idx]
         arr = self._get_processed_array(replay_id)
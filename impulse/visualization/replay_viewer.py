@@ -15,11 +15,11 @@ Usage:
     viewer.display()
 """
 
-import threading
+import asyncio
 from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba
 from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import ipywidgets as widgets
@@ -32,25 +32,40 @@ BLUE_TEAM_COLORS = ['#3b82f6', '#8b5cf6', '#22c55e', '#06b6d4']  # blue, purple,
 ORANGE_TEAM_COLORS = ['#f97316', '#ef4444', '#ec4899', '#eab308']  # orange, red, pink, yellow
 BALL_COLOR = '#d1d5db'  # light gray/silver
 
+# Length of player orientation lines, in game units
+ARROW_SCALE = 200
 
-def quaternion_to_forward(qx: float, qy: float, qz: float, qw: float) -> np.ndarray:
+
+def quaternion_to_forward(qx, qy, qz, qw) -> np.ndarray:
     """
-    Convert quaternion to forward direction vector.
+    Convert quaternion(s) to forward direction vector(s).
 
     Rocket League coordinate system:
     - X: right/left
     - Y: forward/back
     - Z: up/down
 
+    Rotates the RL forward axis (0, 1, 0) in closed form (the second column of
+    the rotation matrix), so whole columns of quaternions convert in one
+    vectorized pass. Quaternions are normalized first, matching scipy's
+    Rotation.from_quat(...).apply([0, 1, 0]).
+
     Args:
-        qx, qy, qz, qw: Quaternion components (scalar-last format)
+        qx, qy, qz, qw: Quaternion components (scalar-last format), as scalars
+                        or equal-length arrays
 
     Returns:
-        np.ndarray of shape (3,) - unit forward vector
+        np.ndarray of shape (3,) for scalar input, or (N, 3) for arrays -
+        unit forward vector(s). NaN components propagate to NaN vectors.
     """
-    from scipy.spatial.transform import Rotation
-    r = Rotation.from_quat([qx, qy, qz, qw])
-    return r.apply([0, 1, 0])  # RL forward axis
+    qx, qy, qz, qw = (np.asarray(q, dtype=np.float64) for q in (qx, qy, qz, qw))
+    norm_sq = qx * qx + qy * qy + qz * qz + qw * qw
+    scale = 2.0 / norm_sq
+    return np.stack([
+        scale * (qx * qy - qw * qz),
+        1.0 - scale * (qx * qx + qz * qz),
+        scale * (qy * qz + qw * qx),
+    ], axis=-1)
 
 
 def get_player_color(player_idx: int, team: int) -> str:
@@ -61,6 +76,59 @@ def get_player_color(player_idx: int, team: int) -> str:
         return ORANGE_TEAM_COLORS[player_idx % len(ORANGE_TEAM_COLORS)]
 
 
+class _Blitter:
+    """
+    Redraws a fixed set of animated artists over a cached figure background.
+
+    Artists are marked animated so full draws leave them out; every full draw
+    (first display, resize, 3D rotation) recaptures the background through the
+    canvas 'draw_event'. Per-frame updates then restore the background and
+    draw only the animated artists. Canvases without blit support, or before
+    the first full draw, fall back to draw_idle().
+
+    With blit_axes=True only the bounding boxes of the axes holding the
+    artists are pushed to the screen instead of the whole figure; use it when
+    the artists stay clipped to their axes.
+    """
+
+    def __init__(self, canvas, artists: List[Any], blit_axes: bool = False):
+        self.canvas = canvas
+        self.artists = list(artists)
+        self.blit_axes = blit_axes
+        self._background = None
+        for artist in self.artists:
+            artist.set_animated(True)
+        self._cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """Capture the clean background, then paint the animated artists on top."""
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        figure = self.canvas.figure
+        for artist in self.artists:
+            # 3D collections cache their projected offsets; refresh them against
+            # the axes' current projection before drawing outside a full draw
+            if hasattr(artist, 'do_3d_projection'):
+                artist.do_3d_projection()
+            figure.draw_artist(artist)
+
+    def update(self):
+        """Repaint the animated artists for the current frame."""
+        if self._background is None or not getattr(self.canvas, 'supports_blit', False):
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        if self.blit_axes:
+            for ax in dict.fromkeys(artist.axes for artist in self.artists):
+                self.canvas.blit(ax.bbox)
+        else:
+            self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
+
+
 class ReplayViewer:
     """
     Interactive Jupyter widget for visualizing Rocket League replay data.
@@ -86,6 +154,12 @@ class ReplayViewer:
         viewer.display()
     """
 
+    # Per-frame position/orientation lookups kept for revisits while scrubbing
+    FRAME_CACHE_SIZE = 128
+
+    # Frame counter updates per second during playback (each one is a widget message)
+    LABEL_UPDATES_PER_SECOND = 4
+
     def __init__(
         self,
         replay: ReplayData,
@@ -124,11 +198,17 @@ class ReplayViewer:
         # Features to plot
         self.features = features if features is not None else ['Ball - position z']
 
+        # Plotted feature columns extracted once into a contiguous float32 block:
+        # (num_frames, num_present_features), column order given by _feature_index
+        present = [f for f in self.features if f in self.frames.columns]
+        self._feature_index = {f: j for j, f in enumerate(present)}
+        self._feature_matrix = self._column_block(present, np.float32)
+
         # Playback settings
         self.playback_fps = playback_fps
         self.speed_multiplier = 1.0
         self.is_playing = False
-        self._timer = None
+        self._task = None  # playback coroutine on the kernel's event loop
 
         # Figure sizes
         self.figsize_3d = figsize_3d
@@ -137,6 +217,27 @@ class ReplayViewer:
         # Player info from metadata
         self._setup_player_info()
 
+        # Position columns gathered once as float32 (ample for field coordinates),
+        # so per-frame lookups are ndarray indexing rather than pandas row access:
+        # (num_frames, 3) for the ball and (num_players, num_frames, 3) for players
+        self._ball_xyz = self._position_table('Ball - position')
+        self._player_xyz = np.stack(
+            [self._position_table(f'p{i}_position') for i in range(self.num_players)]
+        ) if self.num_players else np.empty((0, len(self.frames), 3), dtype=np.float32)
+
+        # Forward vectors for every frame, computed once: (num_frames, 3) per player
+        self._player_forward = [self._compute_forward_vectors(i) for i in range(self.num_players)]
+
+        # Per-frame validity masks, computed once in bulk so a frame lookup tests
+        # a precomputed bool instead of scanning its components for NaN
+        self._ball_valid = ~np.isnan(self._ball_xyz).any(axis=1)
+        self._player_valid = ~np.isnan(self._player_xyz).any(axis=2)  # (num_players, num_frames)
+        self._forward_valid = [~np.isnan(fwd).any(axis=1) for fwd in self._player_forward]
+
+        # FIFO caches of the per-frame lookup dicts, keyed by frame index
+        self._positions_cache: Dict[int, Dict[str, Optional[np.ndarray]]] = {}
+        self._orientations_cache: Dict[int, Dict[str, Optional[np.ndarray]]] = {}
+
         # Will be set up during display()
         self.fig_3d = None
         self.ax_3d = None
@@ -145,11 +246,16 @@ class ReplayViewer:
 
         # Artists (plot elements to update)
         self.ball_scatter = None
-        self.player_scatters = {}
-        self.player_arrows = {}
+        self.player_scatter = None  # one Path3DCollection holding every player's dot
+        self._player_visible = np.zeros(self.num_players, dtype=bool)
+        self.player_arrows = None  # one Line3DCollection holding every player's orientation line
         self.player_labels = {}
         self.frame_markers = []
 
+        # Blitting helpers, created in display() once the artists exist
+        self._blit_3d = None
+        self._blit_2d = None
+
     def _get_num_players(self) -> int:
         """Determine the number of players from metadata."""
         # Try parsing_info first
@@ -185,6 +291,7 @@ class ReplayViewer:
                     'name': f'Player {idx}',
                     'team': 0 if idx < self.num_players // 2 else 1,
                     'color': '#888888',
+                    'rgba': to_rgba('#888888'),
                 }
                 continue
 
@@ -198,52 +305,84 @@ class ReplayViewer:
                 'name': name,
                 'team': team,
                 'color': color,
+                'rgba': to_rgba(color),
             }
 
+        # Parsed once here so per-frame color updates never touch hex strings
+        self._player_rgba = np.array(
+            [self.player_info[i]['rgba'] for i in range(self.num_players)]
+        ).reshape(-1, 4)
+
+    def _column_block(self, cols: List[str], dtype) -> np.ndarray:
+        """
+        (num_frames, len(cols)) array of the given columns.
+
+        Filled column by column from zero-copy views of the frame columns, so no
+        intermediate DataFrame is built for the column subset.
+        """
+        block = np.empty((len(self.frames), len(cols)), dtype=dtype)
+        for j, col in enumerate(cols):
+            block[:, j] = self.frames[col].to_numpy(copy=False)
+        return block
+
+    def _position_table(self, prefix: str) -> np.ndarray:
+        """(num_frames, 3) array of the '{prefix} x/y/z' columns, NaN where missing."""
+        cols = [f'{prefix} {axis}' for axis in 'xyz']
+        if not all(col in self.frames.columns for col in cols):
+            return np.full((len(self.frames), 3), np.nan, dtype=np.float32)
+        return self._column_block(cols, np.float32)
+
+    def _compute_forward_vectors(self, player_idx: int) -> np.ndarray:
+        """Forward vectors for all frames of one player, NaN where orientation is missing."""
+        quat_cols = [f'p{player_idx}_quaternion {axis}' for axis in 'xyzw']
+        if not all(col in self.frames.columns for col in quat_cols):
+            return np.full((len(self.frames), 3), np.nan, dtype=np.float32)
+        qx, qy, qz, qw = (self.frames[col].to_numpy(copy=False) for col in quat_cols)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            forward = quaternion_to_forward(qx, qy, qz, qw)
+        return forward.astype(np.float32)
+
     def _get_entity_positions(self, frame_idx: int) -> Dict[str, Optional[np.ndarray]]:
-        """Extract ball and player positions for a single frame."""
-        row = self.frames.iloc[frame_idx]
+        """Look up ball and player positions for a single frame."""
+        cached = self._positions_cache.get(frame_idx)
+        if cached is not None:
+            return cached
+
         positions = {}
 
         # Ball position
-        ball_x = row.get('Ball - position x')
-        ball_y = row.get('Ball - position y')
-        ball_z = row.get('Ball - position z')
-        if pd.notna(ball_x) and pd.notna(ball_y) and pd.notna(ball_z):
-            positions['ball'] = np.array([ball_x, ball_y, ball_z])
-        else:
-            positions['ball'] = None
+        ball = self._ball_xyz[frame_idx]
+        positions['ball'] = ball if self._ball_valid[frame_idx] else None
 
         # Player positions
         for i in range(self.num_players):
-            px = row.get(f'p{i}_position x')
-            py = row.get(f'p{i}_position y')
-            pz = row.get(f'p{i}_position z')
-            if pd.notna(px) and pd.notna(py) and pd.notna(pz):
-                positions[f'p{i}'] = np.array([px, py, pz])
-            else:
-                positions[f'p{i}'] = None
+            pos = self._player_xyz[i][frame_idx]
+            positions[f'p{i}'] = pos if self._player_valid[i, frame_idx] else None
 
+        self._cache_frame(self._positions_cache, frame_idx, positions)
         return positions
 
     def _get_entity_orientations(self, frame_idx: int) -> Dict[str, Optional[np.ndarray]]:
-        """Extract player orientations (as forward vectors) for a single frame."""
-        row = self.frames.iloc[frame_idx]
+        """Look up player orientations (as forward vectors) for a single frame."""
+        cached = self._orientations_cache.get(frame_idx)
+        if cached is not None:
+            return cached
+
         orientations = {}
 
         for i in range(self.num_players):
-            qx = row.get(f'p{i}_quaternion x')
-            qy = row.get(f'p{i}_quaternion y')
-            qz = row.get(f'p{i}_quaternion z')
-            qw = row.get(f'p{i}_quaternion w')
-
-            if all(pd.notna(q) for q in [qx, qy, qz, qw]):
-                orientations[f'p{i}'] = quaternion_to_forward(qx, qy, qz, qw)
-            else:
-                orientations[f'p{i}'] = None
+            fwd = self._player_forward[i][frame_idx]
+            orientations[f'p{i}'] = fwd if self._forward_valid[i][frame_idx] else None
 
+        self._cache_frame(self._orientations_cache, frame_idx, orientations)
         return orientations
 
+    def _cache_frame(self, cache: Dict[int, Any], frame_idx: int, value: Any):
+        """Insert into a per-frame cache, evicting the oldest entry when full."""
+        if len(cache) >= self.FRAME_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[frame_idx] = value
+
     def _setup_3d_figure(self):
         """Create 3D figure with initial artists."""
         self.fig_3d, self.ax_3d = plt.subplots(
@@ -273,11 +412,20 @@ class ReplayViewer:
                 [], [], [], c=BALL_COLOR, s=100, marker='o', label='Ball'
             )
 
-        # Player scatters and arrows
+        # Player dots: a single scatter, one point per player slot. Missing players
+        # sit at NaN, which matplotlib skips; depth shading is off since it would
+        # mix NaN depths into the shading range (a lone dot was never shaded anyway).
+        player_xyz = self._player_xyz[:, self.current_frame]
+        self._player_visible = self._player_valid[:, self.current_frame]
+        self.player_scatter = self.ax_3d.scatter(
+            player_xyz[:, 0], player_xyz[:, 1], player_xyz[:, 2],
+            c=self._player_rgba, s=80, marker='o', depthshade=False
+        )
+
+        # Player labels
         for i in range(self.num_players):
             key = f'p{i}'
             pos = positions.get(key)
-            fwd = orientations.get(key)
 
             # Get player info
             info = self.player_info.get(i, {'name': f'P{i}', 'color': '#888888'})
@@ -285,37 +433,20 @@ class ReplayViewer:
             name = info['name']
 
             if pos is not None:
-                # Player dot
-                self.player_scatters[key] = self.ax_3d.scatter(
-                    [pos[0]], [pos[1]], [pos[2]],
-                    c=color, s=80, marker='o'
-                )
-
-                # Player label
                 self.player_labels[key] = self.ax_3d.text(
                     pos[0], pos[1], pos[2] + 150,
                     name, fontsize=8, ha='center', color=color
                 )
-
-                # Orientation arrow
-                if fwd is not None:
-                    arrow_scale = 200
-                    self.player_arrows[key] = self.ax_3d.quiver(
-                        pos[0], pos[1], pos[2],
-                        fwd[0] * arrow_scale, fwd[1] * arrow_scale, fwd[2] * arrow_scale,
-                        color=color, arrow_length_ratio=0.3
-                    )
-                else:
-                    self.player_arrows[key] = None
             else:
-                # Invisible placeholders
-                self.player_scatters[key] = self.ax_3d.scatter(
-                    [], [], [], c=color, s=80, marker='o'
-                )
+                # Invisible placeholder
                 self.player_labels[key] = self.ax_3d.text(
                     0, 0, 0, name, fontsize=8, ha='center', color=color, visible=False
                 )
-                self.player_arrows[key] = None
+
+        # Orientation lines: a single persistent collection, updated in place
+        self.player_arrows = Line3DCollection([], linewidths=2)
+        self.ax_3d.add_collection3d(self.player_arrows, autolim=False)
+        self._update_arrows(positions, orientations)
 
         # Set reasonable axis limits based on Rocket League field size
         # RL field is roughly -4096 to 4096 in X, -5120 to 5120 in Y, 0 to 2044 in Z
@@ -336,17 +467,17 @@ class ReplayViewer:
         if n_features == 1:
             self.axes_2d = [self.axes_2d]
 
-        # Get frame range data
-        frame_data = self.frames.iloc[self.start_frame:self.end_frame]
+        # Frame range rows of the feature block (a view, no copy)
+        frame_data = self._feature_matrix[self.start_frame:self.end_frame]
 
         # Always use frame numbers for x-axis
         x_values = np.arange(self.start_frame, self.end_frame)
         self.x_values = x_values
 
         for i, (ax, feature) in enumerate(zip(self.axes_2d, self.features)):
-            if feature in frame_data.columns:
-                y_values = frame_data[feature].values
-                ax.plot(x_values, y_values, linewidth=1)
+            j = self._feature_index.get(feature)
+            if j is not None:
+                ax.plot(x_values, frame_data[:, j], linewidth=1)
 
             ax.set_ylabel(feature, fontsize=8)
             ax.tick_params(labelsize=8)
@@ -419,44 +550,42 @@ class ReplayViewer:
         if ball_pos is not None:
             self.ball_scatter._offsets3d = ([ball_pos[0]], [ball_pos[1]], [ball_pos[2]])
 
-        # Update players
-        for i in range(self.num_players):
-            key = f'p{i}'
-            pos = positions.get(key)
-            fwd = orientations.get(key)
+        # Update player dots in one assignment; missing players stay at NaN
+        player_xyz = self._player_xyz[:, self.current_frame]
+        self._player_visible = self._player_valid[:, self.current_frame]
+        self.player_scatter._offsets3d = (player_xyz[:, 0], player_xyz[:, 1], player_xyz[:, 2])
 
-            if pos is not None:
-                # Update position
-                self.player_scatters[key]._offsets3d = ([pos[0]], [pos[1]], [pos[2]])
-                self.player_scatters[key].set_visible(True)
-
-                # Update label position
-                self.player_labels[key].set_position((pos[0], pos[1]))
-                self.player_labels[key].set_3d_properties(pos[2] + 150)
-                self.player_labels[key].set_visible(True)
-
-                # Update orientation arrow - need to remove old and create new
-                if self.player_arrows.get(key) is not None:
-                    self.player_arrows[key].remove()
-
-                if fwd is not None:
-                    info = self.player_info.get(i, {'color': '#888888'})
-                    arrow_scale = 200
-                    self.player_arrows[key] = self.ax_3d.quiver(
-                        pos[0], pos[1], pos[2],
-                        fwd[0] * arrow_scale, fwd[1] * arrow_scale, fwd[2] * arrow_scale,
-                        color=info['color'], arrow_length_ratio=0.3
-                    )
-                else:
-                    self.player_arrows[key] = None
+        # Update labels
+        for i in range(self.num_players):
+            label = self.player_labels[f'p{i}']
+            if self._player_visible[i]:
+                x, y, z = player_xyz[i]
+                label.set_position((x, y))
+                label.set_3d_properties(z + 150)
+                label.set_visible(True)
             else:
-                self.player_scatters[key].set_visible(False)
-                self.player_labels[key].set_visible(False)
-                if self.player_arrows.get(key) is not None:
-                    self.player_arrows[key].remove()
-                    self.player_arrows[key] = None
+                label.set_visible(False)
 
-        self.fig_3d.canvas.draw_idle()
+        self._update_arrows(positions, orientations)
+
+        self._blit_3d.update()
+
+    def _update_arrows(
+        self,
+        positions: Dict[str, Optional[np.ndarray]],
+        orientations: Dict[str, Optional[np.ndarray]],
+    ):
+        """Point each visible player's orientation line along its forward vector."""
+        segments = []
+        shown = []
+        for i in range(self.num_players):
+            pos = positions.get(f'p{i}')
+            fwd = orientations.get(f'p{i}')
+            if pos is not None and fwd is not None:
+                segments.append(np.stack([pos, pos + fwd * ARROW_SCALE]))
+                shown.append(i)
+        self.player_arrows.set_segments(segments)
+        self.player_arrows.set_color(self._player_rgba[shown])
 
     def _update_2d_markers(self):
         """Update frame markers on 2D plots."""
@@ -469,12 +598,18 @@ class ReplayViewer:
             for marker in self.frame_markers:
                 marker.set_xdata([current_x, current_x])
 
-        self.fig_2d.canvas.draw_idle()
+        self._blit_2d.update()
 
     def _render_frame(self):
         """Update all views for current frame."""
         self._update_3d_view()
         self._update_2d_markers()
+
+        # While playing, only refresh the counter a few times per second
+        if self.is_playing:
+            every = max(1, int(self.playback_fps * self.speed_multiplier) // self.LABEL_UPDATES_PER_SECOND)
+            if (self.current_frame - self.start_frame) % every:
+                return
         self.frame_label.value = self._format_frame_label()
 
     def _on_play_pause(self, button):
@@ -497,38 +632,41 @@ class ReplayViewer:
         """Handle speed slider value change."""
         self.speed_multiplier = change['new']
 
-    def _animation_step(self):
-        """Single animation step - called repeatedly during playback."""
-        if not self.is_playing:
-            return
+    async def _run(self):
+        """Playback loop - one task on the kernel's event loop for the whole run."""
+        while self.is_playing:
+            await asyncio.sleep(1.0 / (self.playback_fps * self.speed_multiplier))
+            if not self._advance_one():
+                break
 
-        # Advance frame
+    def _advance_one(self) -> bool:
+        """Single animation step. Returns False once the end of the range is reached."""
         next_frame = self.current_frame + 1
         if next_frame >= self.end_frame:
             self.pause()
             self.play_button.description = 'Play'
             self.play_button.icon = 'play'
-            return
+            return False
 
         # Update slider (triggers _on_slider_change -> _render_frame)
         self.frame_slider.value = next_frame
-
-        # Schedule next step
-        delay = 1.0 / (self.playback_fps * self.speed_multiplier)
-        self._timer = threading.Timer(delay, self._animation_step)
-        self._timer.start()
+        return True
 
     def play(self):
         """Start playback."""
+        if self.is_playing:
+            return
         self.is_playing = True
-        self._animation_step()
+        self._task = asyncio.ensure_future(self._run())
 
     def pause(self):
         """Pause playback."""
         self.is_playing = False
-        if self._timer is not None:
-            self._timer.cancel()
-            self._timer = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            # Playback may have skipped the counter for the frame it stopped on
+            self.frame_label.value = self._format_frame_label()
 
     def goto_frame(self, frame_idx: int):
         """Jump to a specific frame."""
@@ -549,6 +687,15 @@ class ReplayViewer:
         self._setup_3d_figure()
         self._setup_2d_figure()
 
+        # Only the per-frame artists are redrawn during playback and scrubbing
+        self._blit_3d = _Blitter(self.fig_3d.canvas, [
+            self.ball_scatter,
+            self.player_scatter,
+            *self.player_labels.values(),
+            self.player_arrows,
+        ])
+        self._blit_2d = _Blitter(self.fig_2d.canvas, self.frame_markers, blit_axes=True)
+
         # Re-enable interactive mode
         plt.ion()
 
@@ -569,5 +716,5 @@ class ReplayViewer:
         return layout
 
     def __del__(self):
-        """Cleanup timer on deletion."""
+        """Cancel playback on deletion."""
         self.pause()
@@ -27,7 +27,11 @@ import pandas as pd
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from impulse.collection.database import ImpulseDB
-from impulse.preprocessing.segmentation import find_segment_boundaries, serialize_boundaries
+from impulse.preprocessing.segmentation import (
+    SEGMENTATION_COLUMNS,
+    find_segment_boundaries,
+    serialize_boundaries,
+)
 
 
 def backfill(db: ImpulseDB, data_dir: str = None, s3_manager=None, limit: int = None):
@@ -65,7 +69,7 @@ def backfill(db: ImpulseDB, data_dir: str = None, s3_manager=None, limit: int =
                 failed += 1
                 continue
 
-            df = pd.read_parquet(parquet_path)
+            df = pd.read_parquet(parquet_path, columns=SEGMENTATION_COLUMNS)
             boundaries = find_segment_boundaries(df)
             db.update_segment_boundaries(replay_id, serialize_boundaries(boundaries))
 
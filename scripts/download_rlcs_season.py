@@ -42,6 +42,10 @@ DATABASE_PATH = './impulse.db'
 RATE_LIMIT_PER_SECOND = 2
 RATE_LIMIT_PER_HOUR = None       # Set to None to disable hourly cap (donor tier)
 
+# Concurrent Ballchasing downloads. The rate limits above still apply across
+# all workers; extra workers keep requests in flight while earlier ones transfer.
+DOWNLOAD_WORKERS = 4
+
 # Retry failed downloads after the main run.
 # MAX_RETRIES attempts are made; stops early if all failures are recovered.
 AUTO_RETRY = True
@@ -49,13 +53,6 @@ MAX_RETRIES = 3
 
 # =============================================================================
 
-season_info = RLCSManager.get_season_info(SEASON)
-print(f"Season:            {season_info['name']}")
-print(f"Group ID:          {season_info['group_id']}")
-print(f"Estimated replays: {season_info['estimated_replay_count']:,}")
-print(f"Estimated size:    {season_info['estimated_size_gb']:.1f} GB")
-print()
-
 config = CollectionConfig.from_env()
 config.rate_limit_per_second = RATE_LIMIT_PER_SECOND
 config.rate_limit_per_hour = RATE_LIMIT_PER_HOUR
@@ -71,12 +68,23 @@ elif STORAGE_TYPE == 'local':
 else:
     raise ValueError(f"Unknown STORAGE_TYPE: '{STORAGE_TYPE}'. Must be 's3' or 'local'.")
 
+# Seasons published to the bucket take precedence over the bundled table
+if s3_manager:
+    RLCSManager.load_seasons_from_s3(s3_manager)
+
+season_info = RLCSManager.get_season_info(SEASON)
+print(f"Season:            {season_info.name}")
+print(f"Group ID:          {season_info.group_id}")
+print(f"Estimated replays: {season_info.estimated_replay_count:,}")
+print(f"Estimated size:    {season_info.estimated_size_gb:.1f} GB")
+print()
+
 db = ImpulseDB(DATABASE_PATH, s3_manager=s3_manager)
 
-downloader = ReplayDownloader(client, storage, db)
+downloader = ReplayDownloader(client, storage, db, download_workers=DOWNLOAD_WORKERS)
 
 result = downloader.download_group(
-    group_id=season_info['group_id'],
+    group_id=season_info.group_id,
     path_prefix=PATH_PREFIX + [SEASON],
     is_rlcs=True
 )
@@ -84,7 +92,7 @@ result = downloader.download_group(
 if AUTO_RETRY and result.failed > 0:
     for attempt in range(1, MAX_RETRIES + 1):
         print(f"\nRetry {attempt}/{MAX_RETRIES}: {result.failed} failed replay(s)...")
-        result = downloader.retry_failed_downloads(season_info['group_id'])
+        result = downloader.retry_failed_downloads(season_info.group_id)
         if result.failed == 0:
             print("All replays recovered.")
             break
@@ -8,9 +8,18 @@ back to S3), and pushes the updated database to S3 when done.
 Edit the configuration block below, then run:
     python scripts/parse_all_unparsed.py
 
+Parsing is CPU-bound, so the backlog is split across NUM_WORKERS processes.
+Each worker parses its shard against the pulled database file; the database
+is pushed once, after all shards finish.
+
 Re-running is safe — already-parsed replays are skipped automatically.
 """
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
 from impulse.parsing import ParsingPipeline, ReplayParser
 from impulse.collection.database import ImpulseDB
 from impulse.collection.s3_manager import S3Manager
@@ -39,25 +48,59 @@ MAX_RETRIES = 3
 # Parse at most this many replays (None = all). Useful for testing.
 LIMIT = None
 
+# Parser processes (1 = parse serially in this process)
+NUM_WORKERS = os.cpu_count() or 1
+
 # =============================================================================
 
-s3_manager = S3Manager()
-db = ImpulseDB(DATABASE_PATH, s3_manager=s3_manager)
 
-print("Pulling latest database version from S3...")
-db.pull()
+def parse_shard(shard_index: int, num_shards: int):
+    """Parse one shard of the unparsed backlog. Runs in a worker process."""
+    # No s3_manager on the database: only the parent pushes it
+    db = ImpulseDB(DATABASE_PATH)
+    parser = ReplayParser.from_preset(PRESET, fps=FPS)
+    pipeline = ParsingPipeline(parser, db, s3_manager=S3Manager())
+    # Separate output dirs so one shard's cleanup can't remove another's
+    output_dir = str(Path(OUTPUT_DIR) / f"shard-{shard_index}")
+    return pipeline.parse_unparsed(output_dir, limit=LIMIT, shard=(shard_index, num_shards))
+
+
+def main(num_workers: int = NUM_WORKERS):
+    s3_manager = S3Manager()
+    db = ImpulseDB(DATABASE_PATH, s3_manager=s3_manager)
+
+    print("Pulling latest database version from S3...")
+    db.pull()
+
+    parser = ReplayParser.from_preset(PRESET, fps=FPS)
+    pipeline = ParsingPipeline(parser, db, s3_manager=s3_manager)
+
+    if num_workers > 1:
+        # Spawn rather than fork: a forked worker would inherit the parent's
+        # cached S3 client, pooled TLS sockets and all, and share them
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=spawn) as pool:
+            results = list(pool.map(parse_shard, range(num_workers), [num_workers] * num_workers))
+        # The shards wrote through their own connections; reload what is parsed
+        db.invalidate_caches()
+        failed = sum(r.failed for r in results)
+        print(f"\nAll {num_workers} shards done. "
+              f"Parsed: {sum(r.successful for r in results)}  "
+              f"Skipped: {sum(r.skipped for r in results)}  Failed: {failed}")
+        db.push()
+    else:
+        failed = pipeline.parse_unparsed(OUTPUT_DIR, limit=LIMIT).failed
 
-parser = ReplayParser.from_preset(PRESET, fps=FPS)
-pipeline = ParsingPipeline(parser, db, s3_manager=s3_manager)
+    if AUTO_RETRY and failed > 0:
+        for attempt in range(1, MAX_RETRIES + 1):
+            print(f"\nRetry {attempt}/{MAX_RETRIES}: {failed} failed replay(s)...")
+            failed = pipeline.retry_failed_parses(OUTPUT_DIR).failed
+            if failed == 0:
+                print("All replays recovered.")
+                break
+        else:
+            print(f"Max retries ({MAX_RETRIES}) reached. {failed} replay(s) could not be recovered.")
 
-result = pipeline.parse_unparsed(OUTPUT_DIR, limit=LIMIT)
 
-if AUTO_RETRY and result.failed > 0:
-    for attempt in range(1, MAX_RETRIES + 1):
-        print(f"\nRetry {attempt}/{MAX_RETRIES}: {result.failed} failed replay(s)...")
-        result = pipeline.retry_failed_parses(OUTPUT_DIR)
-        if result.failed == 0:
-            print("All replays recovered.")
-            break
-    else:
-        print(f"Max retries ({MAX_RETRIES}) reached. {result.failed} replay(s) could not be recovered.")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Shared fixtures: synthetic replay frames for kickoff/segmentation tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from impulse.preprocessing import kickoff_setup_detection, segmentation
+from impulse.preprocessing.kickoff_setup_detection import BALL_POS_VEL_COLS
+
+# A non-ball column, so detection has to pick the ball columns out by name
+OTHER_COLS = ['Player 0 - boost']
+
+
+def _make_frames(num_frames, kickoffs, index=None, seed=0):
+    """
+    Synthetic replay frames with the ball moving except during kickoffs.
+
+    Args:
+        num_frames: Number of rows.
+        kickoffs: (start, end_exclusive) row ranges where the ball sits at
+                  the kickoff spot.
+        index: Optional index for the DataFrame (default RangeIndex).
+        seed: Seed for the moving-ball values.
+    """
+    rng = np.random.default_rng(seed)
+    data = rng.uniform(100.0, 1000.0, size=(num_frames, len(OTHER_COLS) + len(BALL_POS_VEL_COLS)))
+    ball = slice(len(OTHER_COLS), None)
+    for start, end in kickoffs:
+        data[start:end, ball] = [0.0, 0.0, 0.0, 0.0, 92.75, 0.0]
+    return pd.DataFrame(data, columns=OTHER_COLS + BALL_POS_VEL_COLS, index=index)
+
+
+def _random_frames(seed):
+    """
+    Frames with a random kickoff layout: kickoffs at the very start or end,
+    single-frame and back-to-back kickoffs, and decoy rows where only some of
+    the ball's x/y values are zero.
+    """
+    rng = np.random.default_rng(seed)
+    num_frames = int(rng.integers(0, 400))
+    kickoffs = []
+    for _ in range(int(rng.integers(0, 8))):
+        start = int(rng.integers(0, num_frames + 1))
+        kickoffs.append((start, start + int(rng.integers(1, 30))))
+    if num_frames and rng.random() < 0.3:
+        kickoffs.append((0, int(rng.integers(1, 20))))
+    if num_frames and rng.random() < 0.3:
+        kickoffs.append((num_frames - int(rng.integers(1, 20)), num_frames))
+
+    frames = _make_frames(num_frames, kickoffs, seed=seed)
+    for row in rng.integers(0, max(num_frames, 1), size=min(num_frames, 5)):
+        cols = rng.choice(['Ball - position x', 'Ball - linear velocity y'], size=1)
+        frames.loc[row, list(cols)] = 0.0
+    return frames
+
+
+@pytest.fixture
+def make_frames():
+    return _make_frames
+
+
+@pytest.fixture
+def random_frames():
+    return _random_frames
+
+
+def _without_numba(fn, *args, **kwargs):
+    """Call fn with the Numba kernels disabled, so the NumPy fallbacks run."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(segmentation, '_numba_boundaries_from_mask', None)
+        mp.setattr(kickoff_setup_detection, '_numba_frame_ranges', None)
+        return fn(*args, **kwargs)
+
+
+@pytest.fixture
+def without_numba():
+    return _without_numba
@@ -0,0 +1,156 @@
+"""Tests for ImpulseDB transaction handling and its in-memory ID caches."""
+
+import multiprocessing
+
+import pytest
+
+from impulse.collection.database import ImpulseDB
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = ImpulseDB(str(tmp_path / "impulse.db"))
+    db.add_replays_bulk([(f"r{i}", {"title": f"Replay {i}"}) for i in range(5)], group_id="g")
+    yield db
+    db.close()
+
+
+def _is_downloaded_in_db(db, replay_id):
+    with db.get_connection() as conn:
+        row = conn.execute("SELECT is_downloaded FROM raw_replays WHERE replay_id = ?", (replay_id,)).fetchone()
+    return bool(row[0])
+
+
+def test_mark_downloaded_updates_cache_after_commit(db):
+    assert not db.is_replay_downloaded("r0")
+    db.mark_downloaded("r0", "raw/r0.replay", 100)
+    assert db.is_replay_downloaded("r0")
+    assert _is_downloaded_in_db(db, "r0")
+
+
+def test_rolled_back_mark_downloaded_is_not_cached(db):
+    db.is_replay_downloaded("r0")  # load the cache
+
+    with pytest.raises(RuntimeError):
+        with db.get_connection():
+            db.mark_downloaded("r0", "raw/r0.replay", 100)
+            raise RuntimeError("abort")
+
+    assert not _is_downloaded_in_db(db, "r0")
+    assert not db.is_replay_downloaded("r0")
+
+
+def test_interrupted_write_rolls_back(db):
+    with pytest.raises(KeyboardInterrupt):
+        with db.get_connection():
+            db.mark_downloaded("r0", "raw/r0.replay", 100)
+            raise KeyboardInterrupt
+
+    assert not db._conn.in_transaction
+    assert not _is_downloaded_in_db(db, "r0")
+
+    # Later writes commit and are visible to other connections
+    db.mark_downloaded("r1", "raw/r1.replay", 100)
+    other = ImpulseDB(str(db.db_path))
+    assert other.is_replay_downloaded("r1")
+    other.close()
+
+
+def test_failed_bulk_mark_downloaded_leaves_cache_untouched(db):
+    db.is_replay_downloaded("r0")  # load the cache
+
+    # The unbindable replay ID fails after r0 and r1 have been updated
+    with pytest.raises(Exception):
+        db.mark_downloaded_bulk([
+            ("r0", "raw/r0.replay", 100),
+            ("r1", "raw/r1.replay", 100),
+            (["bad"], "raw/bad.replay", 100),
+        ])
+
+    for replay_id in ("r0", "r1"):
+        assert not _is_downloaded_in_db(db, replay_id)
+        assert not db.is_replay_downloaded(replay_id)
+
+
+def test_bulk_mark_downloaded_updates_cache(db):
+    db.is_replay_downloaded("r0")  # load the cache
+    db.mark_downloaded_bulk([("r0", "raw/r0.replay", 100), ("r1", "raw/r1.replay", 200)])
+    assert db.is_replay_downloaded("r0") and db.is_replay_downloaded("r1")
+    assert not db.is_replay_downloaded("r2")
+
+
+def test_rolled_back_parse_status_is_not_cached(db):
+    db.add_parsed_replay("r0", "r0", "parsed/r0.parquet", "parquet", 30.0, 100, 10, 1000)
+    assert db.is_replay_parsed("r0")
+
+    with pytest.raises(RuntimeError):
+        with db.get_connection():
+            db.mark_parse_failed("r0", "r0", "boom")
+            db.add_parsed_replay("r1", "r1", "parsed/r1.parquet", "parquet", 30.0, 100, 10, 1000)
+            raise RuntimeError("abort")
+
+    assert db.is_replay_parsed("r0")
+    assert not db.is_replay_parsed("r1")
+
+
+def test_invalidate_caches_picks_up_other_connections(db):
+    assert not db.is_replay_parsed("r0")
+
+    # Another process (here: another connection) parses r0
+    other = ImpulseDB(str(db.db_path))
+    other.add_parsed_replay("r0", "r0", "parsed/r0.parquet", "parquet", 30.0, 100, 10, 1000)
+    other.close()
+
+    assert not db.is_replay_parsed("r0")
+    db.invalidate_caches()
+    assert db.is_replay_parsed("r0")
+
+
+def _parse_many(db_path, worker, count):
+    db = ImpulseDB(db_path)
+    for i in range(count):
+        # add_parsed_replay reads raw_replays before it writes
+        replay_id = f"w{worker}-{i}"
+        db.add_parsed_replay(replay_id, replay_id, f"parsed/{replay_id}.parquet", "parquet", 30.0, 1, 1, 1)
+    db.close()
+
+
+def test_concurrent_processes_write_without_busy_errors(tmp_path):
+    db_path = str(tmp_path / "impulse.db")
+    ImpulseDB(db_path).close()
+
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_parse_many, args=(db_path, w, 100)) for w in range(4)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+    assert [p.exitcode for p in workers] == [0] * 4
+
+    db = ImpulseDB(db_path)
+    assert db.get_parse_stats()['parsed'] == 400
+    db.close()
+
+
+def test_add_replays_bulk_matches_add_replay(tmp_path):
+    metadata = {
+        'title': 'Final', 'date': '2024-01-01', 'duration': 300, 'overtime': True,
+        'blue': {'name': 'A', 'goals': 2}, 'orange': {'name': 'B', 'goals': 3},
+        'min_rank': {'name': 'GC', 'tier': 19}, 'uploader': {'name': 'u', 'steam_id': '1'},
+    }
+    one_by_one = ImpulseDB(str(tmp_path / "single.db"))
+    bulk = ImpulseDB(str(tmp_path / "bulk.db"))
+
+    assert [one_by_one.add_replay(f"r{i}", metadata, group_id="g", is_rlcs=True) for i in range(3)] == [True] * 3
+    assert bulk.add_replays_bulk([(f"r{i}", metadata) for i in range(3)], group_id="g", is_rlcs=True) == 3
+    # Known replays are left alone and not counted as new
+    assert bulk.add_replays_bulk([("r0", {'title': 'changed'}), ("r3", metadata)], group_id="g") == 1
+    one_by_one.add_replay("r0", {'title': 'changed'}, group_id="g")
+    one_by_one.add_replay("r3", metadata, group_id="g")
+
+    def rows(db):
+        with db.get_connection(write=False) as conn:
+            return [dict(r) for r in conn.execute("SELECT * FROM raw_replays ORDER BY replay_id")]
+    assert rows(bulk) == rows(one_by_one)
+    one_by_one.close()
+    bulk.close()
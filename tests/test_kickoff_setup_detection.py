@@ -0,0 +1,71 @@
+"""Tests for kickoff setup detection, checked against a straightforward reference."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from impulse.preprocessing.kickoff_setup_detection import (
+    BALL_POS_VEL_COLS,
+    BALL_POS_VEL_X_Y_COLS,
+    continuous_frame_ranges,
+    kickoff_row_ranges,
+    kickoff_setup_frames,
+)
+
+
+def reference_kickoff_frames(frames):
+    """Ball rows whose x/y position and velocity are all zero."""
+    ball = frames[BALL_POS_VEL_COLS]
+    return ball[(ball[BALL_POS_VEL_X_Y_COLS] == 0.0).all(axis=1)]
+
+
+def reference_ranges(index):
+    """(start, end) of each run of consecutive labels, walking the index one label at a time."""
+    ranges = []
+    for label in index:
+        if ranges and label == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], label)
+        else:
+            ranges.append((label, label))
+    return ranges
+
+
+@pytest.fixture(params=[None, 1000], ids=["range-index", "offset-index"])
+def frames_for_seed(request, random_frames):
+    """random_frames, optionally relabelled to start at an offset."""
+    def build(seed):
+        frames = random_frames(seed)
+        if request.param is not None:
+            frames.index = frames.index + request.param
+        return frames
+    return build
+
+
+def test_kickoff_setup_frames_matches_reference(frames_for_seed):
+    for seed in range(100):
+        frames = frames_for_seed(seed)
+        pd.testing.assert_frame_equal(kickoff_setup_frames(frames), reference_kickoff_frames(frames))
+
+
+def test_continuous_frame_ranges_matches_reference(frames_for_seed, without_numba):
+    for seed in range(100):
+        ks_frames = kickoff_setup_frames(frames_for_seed(seed))
+        expected = reference_ranges(ks_frames.index)
+        assert continuous_frame_ranges(ks_frames).tolist() == expected, seed
+        assert without_numba(continuous_frame_ranges, ks_frames).tolist() == expected, seed
+
+
+def test_kickoff_row_ranges_are_positions(frames_for_seed, without_numba):
+    for seed in range(100):
+        frames = frames_for_seed(seed)
+        is_kickoff = frames.index.isin(reference_kickoff_frames(frames).index)
+        expected = reference_ranges(np.flatnonzero(is_kickoff))
+        assert kickoff_row_ranges(frames).tolist() == expected, seed
+        assert without_numba(kickoff_row_ranges, frames).tolist() == expected, seed
+
+
+def test_no_kickoff_frames(make_frames):
+    frames = make_frames(50, kickoffs=[])
+    assert kickoff_setup_frames(frames).empty
+    assert continuous_frame_ranges(kickoff_setup_frames(frames)).size == 0
+    assert kickoff_row_ranges(frames).size == 0
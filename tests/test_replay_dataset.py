@@ -0,0 +1,69 @@
+"""Tests for ReplayDataset replay selection."""
+
+import random
+
+import pytest
+
+from impulse import replay_dataset
+from impulse.collection.database import ImpulseDB
+from impulse.replay_dataset import ReplayDataset, split_replay_ids
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "impulse.db")
+    db = ImpulseDB(path)
+    replay_ids = [f"replay-{i:03d}" for i in range(200)]
+    random.Random(0).shuffle(replay_ids)  # insertion order != sorted order
+    for replay_id in replay_ids:
+        db.add_parsed_replay(replay_id, replay_id, f"parsed/{replay_id}.parquet", "parquet", 30.0, 100, 10, 1000)
+    # Neither of these is loadable
+    db.add_parsed_replay("no-output", "no-output", "", "parquet", 30.0, 100, 10, 1000)
+    db.mark_parse_failed("replay-000", "replay-000", "boom")
+    db.close()
+    return path
+
+
+def test_seeded_sample_does_not_depend_on_loaded_replay_info(db_path):
+    lazy = ReplayDataset(db_path=db_path)
+    eager = ReplayDataset(db_path=db_path)
+    eager.replay_info  # load the full table first
+
+    for seed in range(5):
+        sampled = lazy.sample_replay_ids(20, seed=seed)
+        assert sampled == eager.sample_replay_ids(20, seed=seed)
+        assert "no-output" not in sampled and "replay-000" not in sampled
+
+
+def test_lazy_and_eager_see_the_same_replays(db_path):
+    lazy = ReplayDataset(db_path=db_path)
+    assert len(lazy.sample_replay_ids(1000, seed=0)) == 199
+    assert sorted(lazy.replay_ids) == sorted(lazy.sample_replay_ids(1000, seed=0))
+
+
+def test_split_replay_ids_is_stable_for_a_seed():
+    ids = [f"replay-{i}" for i in range(10)]
+    train, val, test = split_replay_ids(ids, 0.6, 0.2, 0.2, seed=42)
+
+    # Same membership as every split generated so far with seed=42
+    shuffled = list(ids)
+    random.Random(42).shuffle(shuffled)
+    assert (train, val, test) == (shuffled[:6], shuffled[6:8], shuffled[8:])
+
+
+def test_segment_boundaries_are_cached_on_disk(tmp_path, make_frames, monkeypatch):
+    data_dir, cache_dir = tmp_path / "parsed", tmp_path / "cache"
+    data_dir.mkdir()
+    make_frames(300, kickoffs=[(0, 20), (200, 220)]).to_parquet(data_dir / "replay-a.parquet")
+    expected = [(20, 200), (220, 300)]
+
+    first = ReplayDataset(db_path=None, data_dir=str(data_dir), cache_dir=str(cache_dir))
+    assert first.get_segment_boundaries("replay-a") == expected
+    assert list((cache_dir / "segments").glob("replay-a.min10.v*.json"))
+
+    # A fresh dataset reads the cached file instead of recomputing
+    def fail(*args, **kwargs):
+        raise AssertionError("boundaries recomputed despite the on-disk cache")
+    monkeypatch.setattr(replay_dataset, 'find_segment_boundaries', fail)
+    second = ReplayDataset(db_path=None, data_dir=str(data_dir), cache_dir=str(cache_dir))
+    assert second.get_segment_boundaries("replay-a") == expected
@@ -0,0 +1,66 @@
+"""Tests for ReplayDownloader's pooled download loop."""
+
+import threading
+import time
+
+import pytest
+
+from impulse.collection.database import ImpulseDB
+from impulse.collection.replay_downloader import ReplayDownloader
+from impulse.collection.storage import LocalBackend
+
+
+class FakeClient:
+    """Serves a flat group whose downloads are paced like the rate limiter."""
+
+    def __init__(self, num_replays):
+        self.tree = {
+            'id': 'g',
+            'name': 'Group',
+            'replays': [{'id': f"r{i:02d}"} for i in range(num_replays)],
+            'children': [],
+        }
+        self.downloads = 0
+        self._lock = threading.Lock()
+
+    def build_group_tree(self, group_id):
+        return self.tree
+
+    def download_replay_bytes(self, replay_id):
+        with self._lock:
+            time.sleep(0.02)
+            self.downloads += 1
+        return b"replay"
+
+
+class InterruptingBackend(LocalBackend):
+    """Raises KeyboardInterrupt when the loop reaches interrupt_at."""
+
+    def __init__(self, base_dir, interrupt_at):
+        super().__init__(base_dir)
+        self.interrupt_at = interrupt_at
+
+    def replay_exists(self, replay_id, path_components):
+        if replay_id == self.interrupt_at:
+            raise KeyboardInterrupt
+        return super().replay_exists(replay_id, path_components)
+
+
+def test_interrupt_cancels_queued_downloads(tmp_path):
+    client = FakeClient(60)
+    storage = InterruptingBackend(tmp_path / "raw", interrupt_at="r39")
+    db = ImpulseDB(str(tmp_path / "impulse.db"))
+    downloader = ReplayDownloader(client, storage, db, download_workers=1)
+
+    with pytest.raises(KeyboardInterrupt):
+        downloader.download_group('g', use_cache=False)
+
+    # 39 fetches were queued; only those already running may finish
+    assert client.downloads < 10
+
+    # Replays whose saves finished before the interrupt are recorded
+    saved = {p.stem for p in (tmp_path / "raw").rglob("*.replay")}
+    assert saved
+    for replay_id in saved:
+        assert db.is_replay_downloaded(replay_id)
+    db.close()
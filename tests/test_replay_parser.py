@@ -0,0 +1,76 @@
+"""Tests for ReplayParser file handling, ParseResult column views and the parse cache."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("subtr_actor")
+
+from impulse.parsing.replay_parser import ParseResult, ReplayParser
+
+GLOBAL_FEATURES = ['CurrentTime', 'BallRigidBody']     # 1 + 12 columns
+PLAYER_FEATURES = ['PlayerBoost', 'PlayerAnyJump']      # 1 + 1 columns per player
+
+
+def make_result(array, num_players):
+    return ParseResult(
+        success=True, replay_path='replay.replay', metadata={}, array=array,
+        num_frames=array.shape[0], num_features=array.shape[1], num_players=num_players,
+        fps=30.0, global_features=GLOBAL_FEATURES, player_features=PLAYER_FEATURES,
+    )
+
+
+def test_entity_views_split_columns_without_copying():
+    array = np.arange(5 * 17, dtype=np.float32).reshape(5, 17)
+    views = make_result(array, num_players=2).entity_views()
+
+    assert list(views) == ['global', 'player_0', 'player_1']
+    np.testing.assert_array_equal(views['global'], array[:, :13])
+    np.testing.assert_array_equal(views['player_0'], array[:, 13:15])
+    np.testing.assert_array_equal(views['player_1'], array[:, 15:17])
+    assert all(np.shares_memory(view, array) for view in views.values())
+
+
+def test_entity_views_reject_mismatched_width():
+    with pytest.raises(ValueError):
+        make_result(np.zeros((5, 16), dtype=np.float32), num_players=2).entity_views()
+
+
+def test_parse_cache_round_trip(tmp_path):
+    parser = ReplayParser(GLOBAL_FEATURES, PLAYER_FEATURES, fps=30.0, cache_dir=str(tmp_path))
+    key = parser._cache_key(b'replay bytes')
+    assert parser._load_cached(key) is None
+
+    metadata = {'replay_meta': {'team_zero': [{}], 'team_one': [{}]}}
+    array = np.random.default_rng(0).random((10, 17), dtype=np.float32)
+    parser._store_cached(key, metadata, array)
+
+    cached_metadata, cached_array = parser._load_cached(key)
+    assert cached_metadata == metadata
+    np.testing.assert_array_equal(cached_array, array)
+    assert not cached_array.flags.writeable
+
+
+def test_parse_cache_key_covers_content_and_configuration(tmp_path):
+    parser = ReplayParser(GLOBAL_FEATURES, PLAYER_FEATURES, fps=30.0, cache_dir=str(tmp_path))
+    other_fps = ReplayParser(GLOBAL_FEATURES, PLAYER_FEATURES, fps=10.0, cache_dir=str(tmp_path))
+    reordered = ReplayParser(GLOBAL_FEATURES[::-1], PLAYER_FEATURES, fps=30.0, cache_dir=str(tmp_path))
+
+    key = parser._cache_key(b'replay bytes')
+    assert key == parser._cache_key(b'replay bytes')
+    assert key != parser._cache_key(b'other bytes')
+    assert key != other_fps._cache_key(b'replay bytes')
+    assert key != reordered._cache_key(b'replay bytes')
+
+
+def test_unreadable_paths_fail_without_raising(tmp_path):
+    not_a_dir = tmp_path / "file.replay"
+    not_a_dir.write_bytes(b'')
+    parser = ReplayParser(GLOBAL_FEATURES, PLAYER_FEATURES, fps=30.0)
+
+    results = parser.parse_files(
+        [str(tmp_path / "missing.replay"), str(not_a_dir / "nested.replay")], max_workers=2
+    )
+
+    assert [r.success for r in results] == [False, False]
+    assert results[0].error.startswith("File not found")
+    assert results[1].error.startswith("Cannot access")
@@ -0,0 +1,69 @@
+"""Tests for loading the RLCS season table."""
+
+import pytest
+
+from impulse.collection import rlcs_manager
+from impulse.collection.rlcs_manager import RLCSManager, Season
+
+
+class FakeS3Manager:
+    """Serves a fixed object for get_json()."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def get_json(self, key, default=None):
+        return self.data
+
+
+@pytest.fixture(autouse=True)
+def restore_seasons(monkeypatch):
+    monkeypatch.setattr(RLCSManager, 'SEASONS', RLCSManager.SEASONS)
+
+
+def _entry(group_id, **extra):
+    return {
+        'group_id': group_id, 'name': 'RLCS 2027', 'estimated_replay_count': 100,
+        'is_active': True, 'last_updated': '2027-01-01', **extra,
+    }
+
+
+def test_unknown_fields_are_ignored():
+    loaded = RLCSManager.load_seasons_from_s3(FakeS3Manager({
+        '2027': _entry('rlcs-2027-abc', region='EU'),
+    }))
+    assert loaded == 1
+    assert RLCSManager.SEASONS['2027'] == Season('rlcs-2027-abc', 'RLCS 2027', 100, True, '2027-01-01')
+
+
+def test_malformed_entry_is_skipped_alone():
+    bundled = RLCSManager.SEASONS['2024']
+    loaded = RLCSManager.load_seasons_from_s3(FakeS3Manager({
+        '2027': _entry('rlcs-2027-abc'),
+        '2028': {'group_id': 'rlcs-2028-xyz'},  # missing required fields
+        '2029': 'not an entry',
+    }))
+    assert loaded == 1
+    assert '2027' in RLCSManager.SEASONS
+    assert '2028' not in RLCSManager.SEASONS and '2029' not in RLCSManager.SEASONS
+    assert RLCSManager.SEASONS['2024'] == bundled
+
+
+def test_malformed_table_keeps_bundled_seasons():
+    bundled = dict(RLCSManager.SEASONS)
+    assert RLCSManager.load_seasons_from_s3(FakeS3Manager(['not', 'a', 'table'])) == 0
+    assert dict(RLCSManager.SEASONS) == bundled
+
+
+def test_dry_run_does_not_create_bucket(monkeypatch):
+    def no_backend(*args, **kwargs):
+        raise AssertionError("S3Backend built before confirmation")
+
+    monkeypatch.setattr(rlcs_manager, 'S3Manager', lambda: FakeS3Manager({'2027': _entry('rlcs-2027-abc')}))
+    monkeypatch.setattr(rlcs_manager, 'S3Backend', no_backend)
+
+    manager = RLCSManager(storage_type='s3')
+    assert manager.download_season('2027', dry_run=True) is None
+    assert manager.download_season('unknown', dry_run=True) is None
+    monkeypatch.setattr('builtins.input', lambda prompt: 'no')
+    assert manager.download_season('2027') is None
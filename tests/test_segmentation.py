@@ -0,0 +1,67 @@
+"""Tests for segment boundaries, checked against a straightforward reference."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from impulse.preprocessing import _kickoff_numba
+from impulse.preprocessing.kickoff_setup_detection import BALL_POS_VEL_X_Y_COLS
+from impulse.preprocessing.segmentation import find_segment_boundaries
+
+requires_numba = pytest.mark.skipif(_kickoff_numba.boundaries_from_mask is None, reason="numba not installed")
+
+
+def reference_boundaries(frames, min_segment_frames):
+    """Segments between kickoff rows, walking row positions one at a time."""
+    is_kickoff = (frames[BALL_POS_VEL_X_Y_COLS] == 0.0).all(axis=1).to_list()
+    boundaries, start = [], 0
+    for pos, kickoff in enumerate(is_kickoff + [True]):
+        if kickoff:
+            if pos - start >= min_segment_frames and pos > start:
+                boundaries.append((start, pos))
+            start = pos + 1
+    return boundaries
+
+
+@pytest.mark.parametrize("min_segment_frames", [1, 10, 50])
+def test_matches_reference(random_frames, without_numba, min_segment_frames):
+    for seed in range(100):
+        frames = random_frames(seed)
+        expected = reference_boundaries(frames, min_segment_frames)
+        assert find_segment_boundaries(frames, min_segment_frames) == expected, seed
+        assert without_numba(find_segment_boundaries, frames, min_segment_frames) == expected, seed
+
+
+@pytest.mark.parametrize("min_segment_frames", [1, 10])
+def test_boundaries_are_row_positions_for_any_index(random_frames, without_numba, min_segment_frames):
+    for seed in range(50):
+        frames = random_frames(seed)
+        expected = reference_boundaries(frames, min_segment_frames)
+        reindexed = frames.set_axis(np.arange(len(frames))[::-1] * 7)  # descending, non-contiguous labels
+        assert find_segment_boundaries(reindexed, min_segment_frames) == expected, seed
+        assert without_numba(find_segment_boundaries, reindexed, min_segment_frames) == expected, seed
+
+
+@requires_numba
+def test_numba_and_fallback_agree_on_non_default_index(make_frames, without_numba):
+    kickoffs = [(0, 20), (150, 170), (400, 430)]
+    index = pd.RangeIndex(1000, 1000 + 2 * 500, 2)  # e.g. a sliced, downsampled replay
+    frames = make_frames(500, kickoffs, index=index)
+
+    compiled = find_segment_boundaries(frames)
+    assert compiled == [(20, 150), (170, 400), (430, 500)]
+    assert without_numba(find_segment_boundaries, frames) == compiled
+
+
+def test_goalless_replay_still_splits_at_overtime_kickoff(make_frames):
+    # Opening kickoff, 0-0 regulation, then the overtime kickoff
+    frames = make_frames(300, kickoffs=[(0, 20), (200, 220)])
+    assert find_segment_boundaries(frames) == [(20, 200), (220, 300)]
+
+
+def test_no_kickoffs_is_one_segment(make_frames, without_numba):
+    frames = make_frames(100, kickoffs=[])
+    assert find_segment_boundaries(frames) == [(0, 100)]
+    assert without_numba(find_segment_boundaries, frames) == [(0, 100)]
+    assert find_segment_boundaries(frames, min_segment_frames=101) == []
+    assert without_numba(find_segment_boundaries, frames, min_segment_frames=101) == []